@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-30 12:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='equipment',
+            index=models.Index(fields=['session', 'equipment_type'], name='api_equipme_session_6dd05c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='uploadsession',
+            index=models.Index(fields=['user', '-uploaded_at'], name='api_uploads_user_id_71018f_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+import json
+
+from django.db import migrations, models
+
+
+def copy_summary_forward(apps, schema_editor):
+    UploadSession = apps.get_model('api', 'UploadSession')
+    for session in UploadSession.objects.exclude(summary_json__isnull=True).exclude(summary_json=''):
+        session.summary = json.loads(session.summary_json)
+        session.save(update_fields=['summary'])
+
+
+def copy_summary_backward(apps, schema_editor):
+    UploadSession = apps.get_model('api', 'UploadSession')
+    for session in UploadSession.objects.exclude(summary={}):
+        session.summary_json = json.dumps(session.summary)
+        session.save(update_fields=['summary_json'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_equipment_api_equipme_session_6dd05c_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadsession',
+            name='summary',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(copy_summary_forward, copy_summary_backward),
+        migrations.RemoveField(
+            model_name='uploadsession',
+            name='summary_json',
+        ),
+    ]
@@ -0,0 +1,61 @@
+from django.db import migrations, models
+
+TYPE_CODES = {
+    'Pump': 0,
+    'Compressor': 1,
+    'Valve': 2,
+    'HeatExchanger': 3,
+    'Reactor': 4,
+    'Condenser': 5,
+    'Other': 6,
+}
+
+
+def codes_forward(apps, schema_editor):
+    Equipment = apps.get_model('api', 'Equipment')
+    for label, code in TYPE_CODES.items():
+        Equipment.objects.filter(equipment_type=label).update(equipment_type_code=code)
+
+
+def codes_backward(apps, schema_editor):
+    Equipment = apps.get_model('api', 'Equipment')
+    for label, code in TYPE_CODES.items():
+        Equipment.objects.filter(equipment_type_code=code).update(equipment_type=label)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_uploadsession_summary_jsonfield'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='equipment',
+            name='api_equipme_session_6dd05c_idx',
+        ),
+        migrations.AddField(
+            model_name='equipment',
+            name='equipment_type_code',
+            field=models.SmallIntegerField(default=6),
+        ),
+        migrations.RunPython(codes_forward, codes_backward),
+        migrations.RemoveField(
+            model_name='equipment',
+            name='equipment_type',
+        ),
+        migrations.RenameField(
+            model_name='equipment',
+            old_name='equipment_type_code',
+            new_name='equipment_type',
+        ),
+        migrations.AlterField(
+            model_name='equipment',
+            name='equipment_type',
+            field=models.SmallIntegerField(choices=[(0, 'Pump'), (1, 'Compressor'), (2, 'Valve'), (3, 'HeatExchanger'), (4, 'Reactor'), (5, 'Condenser'), (6, 'Other')], default=6),
+        ),
+        migrations.AddIndex(
+            model_name='equipment',
+            index=models.Index(fields=['session', 'equipment_type'], name='api_equipme_session_6dd05c_idx'),
+        ),
+    ]
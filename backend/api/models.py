@@ -1,9 +1,12 @@
 """
 Models for Chemical Equipment Parameter Visualizer.
 """
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
-import json
 
 
 class UploadSession(models.Model):
@@ -12,51 +15,55 @@ class UploadSession(models.Model):
     filename = models.CharField(max_length=255)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     record_count = models.IntegerField(default=0)
-    summary_json = models.TextField(blank=True, null=True)
+    summary = models.JSONField(default=dict, blank=True)
     
     class Meta:
         ordering = ['-uploaded_at']
+        indexes = [
+            models.Index(fields=['user', '-uploaded_at']),
+        ]
     
     def __str__(self):
         return f"{self.filename} ({self.uploaded_at.strftime('%Y-%m-%d %H:%M')})"
-    
-    @property
-    def summary(self):
-        """Parse and return the summary as a dictionary."""
-        if self.summary_json:
-            return json.loads(self.summary_json)
-        return {}
-    
-    @summary.setter
-    def summary(self, value):
-        """Store the summary as JSON."""
-        self.summary_json = json.dumps(value)
-    
+
     @classmethod
     def cleanup_old_sessions(cls, user, keep_count=5):
         """Keep only the last N sessions for a user."""
-        sessions = cls.objects.filter(user=user).order_by('-uploaded_at')
-        if sessions.count() > keep_count:
-            # Get IDs of sessions to delete
-            ids_to_delete = sessions[keep_count:].values_list('id', flat=True)
-            cls.objects.filter(id__in=list(ids_to_delete)).delete()
+        # Single DELETE with a subquery on the newest IDs; no COUNT round
+        # trip and no ID list materialized in Python
+        keep_ids = cls.objects.filter(user=user).order_by(
+            '-uploaded_at'
+        ).values_list('id', flat=True)[:keep_count]
+        cls.objects.filter(user=user).exclude(
+            id__in=models.Subquery(keep_ids)
+        ).delete()
+
+
+@receiver(post_delete, sender=UploadSession)
+def _invalidate_pdf_cache(sender, instance, **kwargs):
+    """Drop the cached and persisted PDF when a session is deleted."""
+    cache.delete(f'pdf:{instance.id}')
+    report_path = settings.MEDIA_ROOT / 'reports' / f'{instance.id}.pdf'
+    report_path.unlink(missing_ok=True)
 
 
 class Equipment(models.Model):
     """Chemical equipment with parameters."""
+    # Small ints halve the bytes per row vs the old CharField and make the
+    # type GROUP BY compare integers; labels keep the original API tokens
     EQUIPMENT_TYPES = [
-        ('Pump', 'Pump'),
-        ('Compressor', 'Compressor'),
-        ('Valve', 'Valve'),
-        ('HeatExchanger', 'Heat Exchanger'),
-        ('Reactor', 'Reactor'),
-        ('Condenser', 'Condenser'),
-        ('Other', 'Other'),
+        (0, 'Pump'),
+        (1, 'Compressor'),
+        (2, 'Valve'),
+        (3, 'HeatExchanger'),
+        (4, 'Reactor'),
+        (5, 'Condenser'),
+        (6, 'Other'),
     ]
-    
+
     session = models.ForeignKey(UploadSession, on_delete=models.CASCADE, related_name='equipment')
     name = models.CharField(max_length=100)
-    equipment_type = models.CharField(max_length=50, choices=EQUIPMENT_TYPES)
+    equipment_type = models.SmallIntegerField(choices=EQUIPMENT_TYPES, default=6)
     flowrate = models.FloatField()
     pressure = models.FloatField()
     temperature = models.FloatField()
@@ -64,6 +71,15 @@ class Equipment(models.Model):
     class Meta:
         ordering = ['name']
         verbose_name_plural = 'Equipment'
+        indexes = [
+            models.Index(fields=['session', 'equipment_type']),
+        ]
     
     def __str__(self):
-        return f"{self.name} ({self.equipment_type})"
+        return f"{self.name} ({self.get_equipment_type_display()})"
+
+
+# Code <-> label lookups for whole-column CSV validation and API output
+EQUIPMENT_TYPE_LABELS = dict(Equipment.EQUIPMENT_TYPES)
+EQUIPMENT_TYPE_CODES = {label: code for code, label in Equipment.EQUIPMENT_TYPES}
+OTHER_TYPE_CODE = EQUIPMENT_TYPE_CODES['Other']
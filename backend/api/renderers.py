@@ -0,0 +1,29 @@
+"""
+Custom DRF renderers for Chemical Equipment Parameter Visualizer.
+"""
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonRenderer(BaseRenderer):
+    """JSON renderer backed by orjson when available.
+
+    orjson encodes large payloads (e.g. the equipment list) several times
+    faster than the stdlib encoder; fall back to json if it isn't installed.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is not None:
+            return orjson.dumps(data, default=str)
+        return json.dumps(data, default=str).encode('utf-8')
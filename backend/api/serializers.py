@@ -8,6 +8,8 @@ from .models import Equipment, UploadSession
 
 class EquipmentSerializer(serializers.ModelSerializer):
     """Serializer for Equipment model."""
+    equipment_type = serializers.CharField(source='get_equipment_type_display', read_only=True)
+
     class Meta:
         model = Equipment
         fields = ['id', 'name', 'equipment_type', 'flowrate', 'pressure', 'temperature']
@@ -16,14 +18,11 @@ class EquipmentSerializer(serializers.ModelSerializer):
 class UploadSessionSerializer(serializers.ModelSerializer):
     """Serializer for UploadSession model."""
     equipment_count = serializers.IntegerField(source='record_count', read_only=True)
-    summary = serializers.SerializerMethodField()
-    
+    summary = serializers.JSONField(read_only=True)
+
     class Meta:
         model = UploadSession
         fields = ['id', 'filename', 'uploaded_at', 'equipment_count', 'summary']
-    
-    def get_summary(self, obj):
-        return obj.summary
 
 
 class SummarySerializer(serializers.Serializer):
@@ -14,6 +14,7 @@ urlpatterns = [
     path('upload/', views.UploadCSVView.as_view(), name='upload'),
     path('equipment/', views.EquipmentListView.as_view(), name='equipment-list'),
     path('summary/', views.SummaryView.as_view(), name='summary'),
+    path('summary/batch/', views.SummaryBatchView.as_view(), name='summary-batch'),
     path('history/', views.HistoryListView.as_view(), name='history'),
     
     # Reports
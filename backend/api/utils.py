@@ -1,8 +1,12 @@
 """
 Utility functions for data analysis and PDF generation.
 """
+import csv
 import io
 import pandas as pd
+from django.db.models import Avg, Count, Max, Min
+
+from .models import EQUIPMENT_TYPE_CODES, EQUIPMENT_TYPE_LABELS, OTHER_TYPE_CODE
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -10,14 +14,34 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.units import inch
 
 
+# Below this size, pandas' CSV machinery costs more than it saves
+SMALL_CSV_BYTES = 1 << 20
+
+
+def _parse_csv_small(file, known_cols):
+    """Tokenize a small CSV with csv.reader, skipping pandas' parse path."""
+    text = io.TextIOWrapper(file, encoding='utf-8', newline='')
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if not header:
+            return pd.DataFrame()
+        keep = [i for i, col in enumerate(header) if col in known_cols]
+        columns = {header[i]: [] for i in keep}
+        for row in reader:
+            for i in keep:
+                columns[header[i]].append(row[i] if i < len(row) else '')
+        return pd.DataFrame(columns)
+    finally:
+        text.detach()
+
+
 def parse_csv(file):
     """
     Parse uploaded CSV file and return DataFrame.
-    
+
     Expected columns: Equipment Name, Type, Flowrate, Pressure, Temperature
     """
-    df = pd.read_csv(file)
-    
     # Standardize column names
     column_mapping = {
         'Equipment Name': 'name',
@@ -26,7 +50,24 @@ def parse_csv(file):
         'Pressure': 'pressure',
         'Temperature': 'temperature'
     }
-    
+    known_cols = set(column_mapping) | set(column_mapping.values())
+
+    size = getattr(file, 'size', None)
+    if size is not None and size <= SMALL_CSV_BYTES:
+        # Small uploads: a plain csv.reader pass beats pandas' fixed overhead
+        df = _parse_csv_small(file, known_cols)
+    else:
+        # Parse only the columns we use; the pyarrow engine is several times
+        # faster on numeric CSVs when available
+        header = pd.read_csv(file, nrows=0)
+        usecols = [c for c in header.columns if c in known_cols]
+        file.seek(0)
+        try:
+            df = pd.read_csv(file, usecols=usecols, engine='pyarrow')
+        except ImportError:
+            file.seek(0)
+            df = pd.read_csv(file, usecols=usecols)
+
     # Rename columns that exist
     for old_name, new_name in column_mapping.items():
         if old_name in df.columns:
@@ -45,7 +86,15 @@ def parse_csv(file):
     
     # Drop rows with NaN values
     df = df.dropna(subset=['flowrate', 'pressure', 'temperature'])
-    
+
+    # Map equipment types to their integer codes column-wise (bulk_create
+    # skips per-model choice validation); unknown types fall back to 'Other'
+    df['equipment_type'] = (
+        df['equipment_type'].map(EQUIPMENT_TYPE_CODES)
+        .fillna(OTHER_TYPE_CODE)
+        .astype('int16')
+    )
+
     return df
 
 
@@ -53,7 +102,22 @@ def calculate_summary(equipment_queryset):
     """
     Calculate summary statistics from an equipment queryset.
     """
-    if not equipment_queryset.exists():
+    # Aggregate everything server-side instead of pulling each row into Python;
+    # total_count doubles as the emptiness check, so no separate .exists() query
+    agg = equipment_queryset.aggregate(
+        total_count=Count('id'),
+        avg_flowrate=Avg('flowrate'),
+        min_flowrate=Min('flowrate'),
+        max_flowrate=Max('flowrate'),
+        avg_pressure=Avg('pressure'),
+        min_pressure=Min('pressure'),
+        max_pressure=Max('pressure'),
+        avg_temperature=Avg('temperature'),
+        min_temperature=Min('temperature'),
+        max_temperature=Max('temperature'),
+    )
+
+    if not agg['total_count']:
         return {
             'total_count': 0,
             'avg_flowrate': 0,
@@ -67,29 +131,29 @@ def calculate_summary(equipment_queryset):
             'max_temperature': 0,
             'type_distribution': {}
         }
-    
-    # Get all values
-    flowrates = list(equipment_queryset.values_list('flowrate', flat=True))
-    pressures = list(equipment_queryset.values_list('pressure', flat=True))
-    temperatures = list(equipment_queryset.values_list('temperature', flat=True))
-    
-    # Type distribution
-    type_counts = {}
-    for eq in equipment_queryset.values('equipment_type'):
-        eq_type = eq['equipment_type']
-        type_counts[eq_type] = type_counts.get(eq_type, 0) + 1
-    
+
+    # Type distribution as a single GROUP BY; translate codes back to labels.
+    # The empty order_by() strips the model's default ordering so the query
+    # groups without an extra ORDER BY name
+    type_counts = {
+        EQUIPMENT_TYPE_LABELS.get(code, 'Other'): count
+        for code, count in
+        equipment_queryset.values_list('equipment_type')
+        .annotate(count=Count('id'))
+        .order_by()
+    }
+
     return {
-        'total_count': len(flowrates),
-        'avg_flowrate': round(sum(flowrates) / len(flowrates), 2),
-        'avg_pressure': round(sum(pressures) / len(pressures), 2),
-        'avg_temperature': round(sum(temperatures) / len(temperatures), 2),
-        'min_flowrate': round(min(flowrates), 2),
-        'max_flowrate': round(max(flowrates), 2),
-        'min_pressure': round(min(pressures), 2),
-        'max_pressure': round(max(pressures), 2),
-        'min_temperature': round(min(temperatures), 2),
-        'max_temperature': round(max(temperatures), 2),
+        'total_count': agg['total_count'],
+        'avg_flowrate': round(agg['avg_flowrate'], 2),
+        'avg_pressure': round(agg['avg_pressure'], 2),
+        'avg_temperature': round(agg['avg_temperature'], 2),
+        'min_flowrate': round(agg['min_flowrate'], 2),
+        'max_flowrate': round(agg['max_flowrate'], 2),
+        'min_pressure': round(agg['min_pressure'], 2),
+        'max_pressure': round(agg['max_pressure'], 2),
+        'min_temperature': round(agg['min_temperature'], 2),
+        'max_temperature': round(agg['max_temperature'], 2),
         'type_distribution': type_counts
     }
 
@@ -179,10 +243,10 @@ def generate_pdf_report(session, equipment_list, summary):
     elements.append(Paragraph("Equipment Data", heading_style))
     
     eq_data = [['Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']]
-    for eq in equipment_list[:50]:  # Limit to 50 rows for PDF
+    for eq in equipment_list:  # Caller limits rows (50 for the PDF table)
         eq_data.append([
             eq.name,
-            eq.equipment_type,
+            eq.get_equipment_type_display(),
             str(eq.flowrate),
             str(eq.pressure),
             str(eq.temperature)
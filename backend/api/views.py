@@ -1,13 +1,20 @@
 """
 API Views for Chemical Equipment Parameter Visualizer.
 """
+import io
+import json
+
 from rest_framework import status, views, generics
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.authtoken.models import Token
 from rest_framework.parsers import MultiPartParser, FormParser
+from django.conf import settings
 from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.http import HttpResponse
+from django.utils.http import http_date
 
 from .models import Equipment, UploadSession
 from .serializers import (
@@ -36,9 +43,10 @@ class LoginView(views.APIView):
         
         if user:
             token, _ = Token.objects.get_or_create(user=user)
+            # Fixed shape, so skip DRF's field-by-field serializer traversal
             return Response({
                 'token': token.key,
-                'user': UserSerializer(user).data
+                'user': {'id': user.id, 'username': user.username, 'email': user.email}
             })
         
         return Response(
@@ -101,30 +109,20 @@ class UploadCSVView(views.APIView):
             # Parse CSV
             df = parse_csv(file)
             
-            # Create upload session
-            session = UploadSession.objects.create(
-                user=request.user,
-                filename=file.name,
-                record_count=len(df)
-            )
-            
-            # Create equipment records
-            equipment_objects = []
-            for _, row in df.iterrows():
-                equipment_objects.append(Equipment(
-                    session=session,
-                    name=row['name'],
-                    equipment_type=row['equipment_type'],
-                    flowrate=row['flowrate'],
-                    pressure=row['pressure'],
-                    temperature=row['temperature']
-                ))
-            Equipment.objects.bulk_create(equipment_objects)
-            
-            # Calculate and store summary
-            summary = calculate_summary(session.equipment.all())
-            session.summary = summary
-            session.save()
+            with transaction.atomic():
+                # Create upload session
+                session = UploadSession.objects.create(
+                    user=request.user,
+                    filename=file.name,
+                    record_count=len(df)
+                )
+
+                self._insert_equipment(session, df)
+
+                # Calculate and store summary
+                summary = calculate_summary(session.equipment.all())
+                session.summary = summary
+                session.save()
             
             # Cleanup old sessions (keep only last 5)
             UploadSession.cleanup_old_sessions(request.user)
@@ -148,29 +146,87 @@ class UploadCSVView(views.APIView):
             )
 
 
+    @staticmethod
+    def _insert_equipment(session, df):
+        """Insert parsed equipment rows for a session as fast as the DB allows.
+
+        On Postgres a single COPY stream already avoids the per-batch round
+        trips that driver-level pipelining (psycopg3 pipeline mode) would
+        otherwise hide, so no pipeline setup is needed here.
+        """
+        columns = ['name', 'equipment_type', 'flowrate', 'pressure', 'temperature']
+
+        if connection.vendor == 'postgresql':
+            # COPY skips the INSERT protocol parser entirely and is several
+            # times faster than even batched multirow INSERTs
+            buf = io.StringIO()
+            df.assign(session_id=session.id)[['session_id'] + columns].to_csv(
+                buf, header=False, index=False
+            )
+            buf.seek(0)
+            with connection.cursor() as cursor:
+                cursor.copy_expert(
+                    'COPY api_equipment (session_id, name, equipment_type, '
+                    'flowrate, pressure, temperature) FROM STDIN WITH CSV',
+                    buf
+                )
+            return
+
+        # Create equipment records column-wise (iterrows builds a
+        # Series per row, which dominates parse time on large CSVs)
+        names, types, flowrates, pressures, temperatures = (
+            df[col].to_numpy() for col in columns
+        )
+        equipment_objects = [
+            Equipment(
+                session=session,
+                name=name,
+                equipment_type=int(eq_type),
+                flowrate=float(flowrate),
+                pressure=float(pressure),
+                temperature=float(temperature)
+            )
+            for name, eq_type, flowrate, pressure, temperature
+            in zip(names, types, flowrates, pressures, temperatures)
+        ]
+        Equipment.objects.bulk_create(equipment_objects, batch_size=10000)
+
+
 class EquipmentListView(generics.ListAPIView):
     """List equipment from the latest upload session."""
     serializer_class = EquipmentSerializer
-    
+
     def get_queryset(self):
         session_id = self.request.query_params.get('session_id')
-        
+
         if session_id:
             return Equipment.objects.filter(
                 session_id=session_id,
                 session__user=self.request.user
             )
-        
+
         # Get latest session
         latest_session = UploadSession.objects.filter(
             user=self.request.user
         ).first()
-        
+
         if latest_session:
             return Equipment.objects.filter(session=latest_session)
-        
+
         return Equipment.objects.none()
 
+    def list(self, request, *args, **kwargs):
+        # Stream rows in chunks instead of materializing the whole session
+        # in the queryset result cache; both frontends expect a flat list,
+        # so the response shape stays unpaginated
+        queryset = self.filter_queryset(self.get_queryset()).only(
+            'id', 'name', 'equipment_type', 'flowrate', 'pressure', 'temperature'
+        )
+        serializer = self.get_serializer(
+            queryset.iterator(chunk_size=2000), many=True
+        )
+        return Response(serializer.data)
+
 
 class SummaryView(views.APIView):
     """Get summary statistics for the latest or specified session."""
@@ -207,26 +263,72 @@ class SummaryView(views.APIView):
                     'type_distribution': {}
                 })
         
-        # Recalculate summary for accuracy
-        summary = calculate_summary(session.equipment.all())
-        
-        return Response({
+        # Serve the summary stored at upload time; recompute only on demand
+        summary = session.summary
+        if not summary or request.query_params.get('recompute'):
+            summary = calculate_summary(session.equipment.all())
+            session.summary = summary
+            session.save(update_fields=['summary'])
+
+        # Encode once and bypass DRF's renderer/content-negotiation layer
+        body = json.dumps({
             'session_id': session.id,
             'filename': session.filename,
-            'uploaded_at': session.uploaded_at,
+            'uploaded_at': session.uploaded_at.isoformat(),
             **summary
         })
+        return HttpResponse(body, content_type='application/json')
+
+
+class SummaryBatchView(views.APIView):
+    """Get stored summaries for several sessions in one round trip."""
+
+    def post(self, request):
+        session_ids = request.data.get('session_ids')
+        if not isinstance(session_ids, list):
+            return Response(
+                {'error': 'session_ids must be a list'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        summaries = {
+            str(session_id): summary
+            for session_id, summary in UploadSession.objects.filter(
+                id__in=session_ids,
+                user=request.user
+            ).values_list('id', 'summary')
+        }
+        return Response(summaries)
 
 
 class HistoryListView(generics.ListAPIView):
     """List last 5 upload sessions for the user."""
     serializer_class = UploadSessionSerializer
-    
+
     def get_queryset(self):
         return UploadSession.objects.filter(
             user=self.request.user
+        ).only(
+            'id', 'filename', 'uploaded_at', 'record_count', 'summary'
         ).order_by('-uploaded_at')[:5]
 
+    def list(self, request, *args, **kwargs):
+        # History only changes on upload, so the newest uploaded_at is an
+        # exact Last-Modified validator; polling clients get a bodyless 304
+        latest = UploadSession.objects.filter(
+            user=request.user
+        ).values_list('uploaded_at', flat=True).first()
+
+        if latest is not None:
+            last_modified = http_date(latest.timestamp())
+            if request.headers.get('If-Modified-Since') == last_modified:
+                return HttpResponse(status=304)
+            response = super().list(request, *args, **kwargs)
+            response['Last-Modified'] = last_modified
+            return response
+
+        return super().list(request, *args, **kwargs)
+
 
 class PDFReportView(views.APIView):
     """Generate and download PDF report."""
@@ -254,15 +356,37 @@ class PDFReportView(views.APIView):
                     status=status.HTTP_404_NOT_FOUND
                 )
         
-        # Get equipment and summary
-        equipment_list = list(session.equipment.all())
-        summary = calculate_summary(session.equipment.all())
-        
-        # Generate PDF
-        pdf_buffer = generate_pdf_report(session, equipment_list, summary)
-        
+        # Sessions are immutable after upload, so the rendered PDF is served
+        # from two tiers: the in-process cache, then a copy persisted under
+        # MEDIA_ROOT, and only built with ReportLab on a miss of both
+        cache_key = f'pdf:{session.id}'
+        pdf_bytes = cache.get(cache_key)
+
+        if pdf_bytes is None:
+            report_path = settings.MEDIA_ROOT / 'reports' / f'{session.id}.pdf'
+
+            if report_path.exists():
+                pdf_bytes = report_path.read_bytes()
+            else:
+                # Get equipment and summary; the PDF table only shows 50 rows,
+                # so fetch just those columns and rows
+                equipment_list = list(
+                    session.equipment.only(
+                        'name', 'equipment_type', 'flowrate', 'pressure', 'temperature'
+                    )[:50]
+                )
+                summary = calculate_summary(session.equipment.all())
+
+                # Generate PDF
+                pdf_buffer = generate_pdf_report(session, equipment_list, summary)
+                pdf_bytes = pdf_buffer.getvalue()
+                report_path.parent.mkdir(parents=True, exist_ok=True)
+                report_path.write_bytes(pdf_bytes)
+
+            cache.set(cache_key, pdf_bytes, 3600)
+
         # Return PDF response
-        response = HttpResponse(pdf_buffer.getvalue(), content_type='application/pdf')
+        response = HttpResponse(pdf_bytes, content_type='application/pdf')
         response['Content-Disposition'] = f'attachment; filename="equipment_report_{session.id}.pdf"'
-        
+
         return response
@@ -6,9 +6,8 @@ import sys
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 
-from services.api_client import api_client
+from services.api_client import get_api_client
 from ui.login_dialog import LoginDialog
-from ui.main_window import MainWindow
 
 
 def main():
@@ -21,9 +20,15 @@ def main():
     app.setStyle('Fusion')
     
     # Show login dialog
+    api_client = get_api_client()
     login_dialog = LoginDialog(api_client)
     
     if login_dialog.exec_() == LoginDialog.Accepted:
+        # Imported here so matplotlib (pulled in via the charts widget)
+        # loads while the user is already authenticated, not before the
+        # login dialog can appear
+        from ui.main_window import MainWindow
+
         # Show main window
         main_window = MainWindow(api_client)
         main_window.show()
@@ -1,142 +1,345 @@
 """
 API Client for Chemical Equipment Visualizer Desktop App.
 Uses connection pooling and timeouts for better performance.
+
+Concurrency note: bursts of small GETs are overlapped via refresh()'s
+thread pool on the kept-alive requests.Session. An HTTP/2 multiplexing
+client (httpx.AsyncClient) was considered but rejected: the Django/
+gunicorn backend serves HTTP/1.1 only, and the Qt frontend drives this
+client from worker threads, not an asyncio loop.
 """
+import io
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any, List
 
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli  # noqa: F401 — presence lets urllib3 decode br responses
+    _ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    _ACCEPT_ENCODING = None
+
+
+def _encode(payload: Dict[str, Any]) -> bytes:
+    """Encode a JSON request body, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _decode(response) -> Any:
+    """Decode a JSON response body, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 
 # Default timeout for API requests (connect, read)
 DEFAULT_TIMEOUT = (3.0, 10.0)
 
 
+class SingleHostAdapter(HTTPAdapter):
+    """HTTPAdapter tuned for a client that only ever talks to one host.
+
+    The default PoolManager hashes the host into one of ten pools; with a
+    single backend that is pure overhead, so keep exactly one pool sized
+    for the refresh() burst.
+    """
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(1, 32, block=False, **pool_kwargs)
+
+
 class APIClient:
     """HTTP client for communicating with Django backend."""
     
     def __init__(self, base_url: str = "http://localhost:8000/api"):
         self.base_url = base_url
-        self.token: Optional[str] = None
-        # Use Session for connection pooling (reuses TCP connections)
+        # Endpoint URLs are fixed per client; build them once instead of
+        # re-formatting f-strings on every call
+        self._urls = {
+            key: f"{base_url}/{path}"
+            for key, path in (
+                ("login", "auth/login/"),
+                ("register", "auth/register/"),
+                ("logout", "auth/logout/"),
+                ("upload", "upload/"),
+                ("equipment", "equipment/"),
+                ("summary", "summary/"),
+                ("summary_batch", "summary/batch/"),
+                ("history", "history/"),
+                ("pdf", "report/pdf/"),
+            )
+        }
+        self._token: Optional[str] = None
+        # full URL (params included) -> (etag, decoded body) for
+        # conditional GETs
+        self._etag_cache: Dict[str, tuple] = {}
+        # session_id -> summary; sessions are immutable once uploaded
+        self._summary_cache: Dict[int, Dict[str, Any]] = {}
+        # Last-Modified validator and body for the history list
+        self._history_last_modified: Optional[str] = None
+        self._history_cache: Optional[List[Dict[str, Any]]] = None
+        # Use Session for connection pooling (reuses TCP connections);
+        # a tuned adapter keeps bursts (equipment + summary + history) on
+        # kept-alive sockets and retries transient gateway errors
         self.session = requests.Session()
-    
-    def _headers(self) -> Dict[str, str]:
-        """Get request headers with auth token."""
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Token {self.token}"
-        return headers
-    
+        adapter = SingleHostAdapter(
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                # GET only: retrying POSTs would re-submit uploads and
+                # registrations (and re-send already-consumed stream bodies)
+                allowed_methods=frozenset(["GET"])
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Persistent defaults: set once here/at login so requests skips the
+        # per-call header merge in prepare_request
+        self.session.headers["Content-Type"] = "application/json"
+        if _ACCEPT_ENCODING:
+            # Brotli packs JSON lists 20-30% tighter than gzip
+            self.session.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+
+    @property
+    def token(self) -> Optional[str]:
+        """The current auth token."""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        # Mirror into the session headers here so the Authorization string
+        # is formatted once per token change, never per request
+        self._token = value
+        if value:
+            self.session.headers["Authorization"] = f"Token {value}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """Authenticate user and store token."""
-        response = self.session.post(
-            f"{self.base_url}/auth/login/",
-            json={"username": username, "password": password},
+        with self.session.post(
+            self._urls["login"],
+            # Pre-encoded body; the session's JSON Content-Type applies
+            data=_encode({"username": username, "password": password}),
             timeout=DEFAULT_TIMEOUT
-        )
-        response.raise_for_status()
-        data = response.json()
+        ) as response:
+            response.raise_for_status()
+            data = _decode(response)
         self.token = data.get("token")
         return data
-    
+
     def register(self, username: str, email: str, password: str, confirm_password: str) -> Dict[str, Any]:
         """Register a new user."""
-        response = self.session.post(
-            f"{self.base_url}/auth/register/",
-            json={
+        with self.session.post(
+            self._urls["register"],
+            data=_encode({
                 "username": username,
                 "email": email,
                 "password": password,
                 "confirm_password": confirm_password
-            },
+            }),
             timeout=DEFAULT_TIMEOUT
-        )
-        response.raise_for_status()
-        data = response.json()
+        ) as response:
+            response.raise_for_status()
+            data = _decode(response)
         self.token = data.get("token")
         return data
-    
+
     def logout(self) -> None:
-        """Logout and clear token."""
-        try:
-            self.session.post(
-                f"{self.base_url}/auth/logout/",
-                headers=self._headers(),
-                timeout=DEFAULT_TIMEOUT
-            )
-        except:
-            pass
+        """Logout immediately; revoke the server-side token in the background.
+
+        The UI only needs the local token cleared — waiting up to the full
+        request timeout for the revocation round trip would block the exit
+        path for no benefit.
+        """
+        token = self._token
         self.token = None
-    
+        if token is None:
+            return
+
+        def _revoke():
+            try:
+                with self.session.post(
+                    self._urls["logout"],
+                    headers={"Authorization": f"Token {token}"},
+                    timeout=DEFAULT_TIMEOUT
+                ):
+                    pass
+            except requests.RequestException:
+                pass  # Token revocation is best-effort
+
+        threading.Thread(target=_revoke, daemon=True).start()
+
     def upload_csv(self, file_path: str) -> Dict[str, Any]:
         """Upload CSV file to backend."""
-        headers = {}
-        if self.token:
-            headers["Authorization"] = f"Token {self.token}"
-        
         with open(file_path, 'rb') as f:
-            response = self.session.post(
-                f"{self.base_url}/upload/",
+            if MultipartEncoder is not None:
+                # Stream the multipart body straight from the file handle
+                # instead of reading the whole CSV into memory first
+                encoder = MultipartEncoder(
+                    fields={"file": (os.path.basename(file_path), f, "text/csv")}
+                )
+                with self.session.post(
+                    self._urls["upload"],
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
+                    timeout=(3.0, 30.0)  # Longer timeout for file upload
+                ) as response:
+                    response.raise_for_status()
+                    return _decode(response)
+
+            with self.session.post(
+                self._urls["upload"],
                 files={"file": f},
-                headers=headers,
-                timeout=(3.0, 30.0)  # Longer timeout for file upload
-            )
-        response.raise_for_status()
-        return response.json()
+                # Unset the JSON default so requests sets the multipart boundary
+                headers={"Content-Type": None},
+                timeout=(3.0, 30.0)
+            ) as response:
+                response.raise_for_status()
+                return _decode(response)
     
-    def get_equipment(self, session_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get equipment list."""
-        params = {}
+    def _url_with_session(self, key: str, session_id: Optional[int]) -> str:
+        """Append the session_id query string, pre-encoded.
+
+        The only query parameter in this API is an integer id, so the URL
+        can be built with one f-string instead of requests' per-call
+        urlencode of a params dict.
+        """
+        url = self._urls[key]
         if session_id:
-            params["session_id"] = session_id
-        
-        response = self.session.get(
-            f"{self.base_url}/equipment/",
-            headers=self._headers(),
-            params=params,
+            return f"{url}?session_id={session_id}"
+        return url
+
+    def _get_cached(self, url: str):
+        """GET with a conditional If-None-Match; serve 304s from the cache."""
+        cached = self._etag_cache.get(url)
+
+        headers = {}
+        if cached and cached[0]:
+            headers["If-None-Match"] = cached[0]
+
+        with self.session.get(
+            url,
+            headers=headers,
             timeout=DEFAULT_TIMEOUT
-        )
-        response.raise_for_status()
-        return response.json()
-    
+        ) as response:
+            if response.status_code == 304 and cached:
+                return cached[1]
+            response.raise_for_status()
+            data = _decode(response)
+            etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[url] = (etag, data)
+        return data
+
+    def get_equipment(self, session_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get equipment list."""
+        return self._get_cached(self._url_with_session("equipment", session_id))
+
     def get_summary(self, session_id: Optional[int] = None) -> Dict[str, Any]:
         """Get summary statistics."""
-        params = {}
-        if session_id:
-            params["session_id"] = session_id
-        
-        response = self.session.get(
-            f"{self.base_url}/summary/",
-            headers=self._headers(),
-            params=params,
-            timeout=DEFAULT_TIMEOUT
-        )
-        response.raise_for_status()
-        return response.json()
-    
+        return self._get_cached(self._url_with_session("summary", session_id))
+
+    def get_summaries(self, session_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get summaries for several sessions in one POST.
+
+        Avoids the N-requests trap when the history view needs a summary
+        per session; already-fetched sessions come from a local cache.
+        """
+        missing = [sid for sid in session_ids if sid not in self._summary_cache]
+        if missing:
+            with self.session.post(
+                self._urls["summary_batch"],
+                data=_encode({"session_ids": missing}),
+                timeout=DEFAULT_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                for sid, summary in _decode(response).items():
+                    self._summary_cache[int(sid)] = summary
+        return {
+            sid: self._summary_cache[sid]
+            for sid in session_ids if sid in self._summary_cache
+        }
+
     def get_history(self) -> List[Dict[str, Any]]:
-        """Get upload history."""
-        response = self.session.get(
-            f"{self.base_url}/history/",
-            headers=self._headers(),
+        """Get upload history.
+
+        History only changes when an upload or cleanup happens, so a
+        time-based If-Modified-Since validator turns the common polling
+        case into a bodyless 304.
+        """
+        headers = {}
+        if self._history_last_modified and self._history_cache is not None:
+            headers["If-Modified-Since"] = self._history_last_modified
+
+        with self.session.get(
+            self._urls["history"],
+            headers=headers,
             timeout=DEFAULT_TIMEOUT
-        )
-        response.raise_for_status()
-        return response.json()
+        ) as response:
+            if response.status_code == 304 and self._history_cache is not None:
+                return self._history_cache
+            response.raise_for_status()
+            data = _decode(response)
+            self._history_last_modified = response.headers.get("Last-Modified")
+
+        self._history_cache = data if self._history_last_modified else None
+        return data
+
+    def refresh(self, session_id: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch equipment, summary and history concurrently.
+
+        The three GETs are independent, so issuing them through the pooled
+        session in parallel costs max(RTT) instead of the sum.
+        """
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            equipment = pool.submit(self.get_equipment, session_id)
+            summary = pool.submit(self.get_summary, session_id)
+            history = pool.submit(self.get_history)
+        return {
+            "equipment": equipment.result(),
+            "summary": summary.result(),
+            "history": history.result(),
+        }
     
-    def download_pdf(self, session_id: Optional[int] = None) -> bytes:
-        """Download PDF report."""
-        params = {}
-        if session_id:
-            params["session_id"] = session_id
-        
-        response = self.session.get(
-            f"{self.base_url}/report/pdf/",
-            headers=self._headers(),
-            params=params,
+    def download_pdf(self, session_id: Optional[int] = None, out=None) -> bytes:
+        """Download PDF report.
+
+        Streams the body in 64 KiB chunks into ``out`` (any writable
+        file-like object) when given; otherwise returns the bytes.
+        """
+        buffer = out if out is not None else io.BytesIO()
+        with self.session.get(
+            self._url_with_session("pdf", session_id),
+            stream=True,
             timeout=(3.0, 30.0)  # Longer timeout for PDF generation
-        )
-        response.raise_for_status()
-        return response.content
+        ) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=65536):
+                buffer.write(chunk)
+
+        if out is not None:
+            return out
+        return buffer.getvalue()
     
     @property
     def is_authenticated(self) -> bool:
@@ -144,5 +347,14 @@ class APIClient:
         return self.token is not None
 
 
-# Global API client instance
-api_client = APIClient()
+# Shared client instance, built lazily so importing this module costs
+# nothing (no Session, adapters or URL table until first use)
+_api_client: Optional[APIClient] = None
+
+
+def get_api_client() -> APIClient:
+    """Return the process-wide APIClient, creating it on first call."""
+    global _api_client
+    if _api_client is None:
+        _api_client = APIClient()
+    return _api_client
@@ -2,18 +2,44 @@
 Enhanced Charts Widget for Chemical Equipment Visualizer.
 Includes: Bar charts, Pie charts, Scatter plots, Box plots, Correlation heatmap, and Statistics.
 Supports mouse scroll zoom on correlation and comparison charts.
+
+Rendering path: the stock Qt5Agg canvas is kept deliberately. Since
+matplotlib 3.1 its paintEvent wraps the Agg buffer_rgba() memoryview in a
+QImage without copying, so a hand-rolled Agg-to-QImage widget would
+duplicate that while losing the canvas mouse events the zoom handlers
+need. A partial port to pyqtgraph (bar/scatter/histogram/rankings) was
+also weighed and dropped: it would split the styling across two plotting
+stacks for charts whose redraws are already bounded by the dirty-tab
+gating, in-place artist updates and the refresh debounce.
 """
+from collections import defaultdict
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QScrollArea,
     QGridLayout, QTabWidget
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Applied once at import: re-running this per widget re-parses the style
+# sheet and resets global rcParams on every construction
+plt.style.use('dark_background')
+
+# More scatter points than this cannot be told apart on screen, so larger
+# datasets are decimated before plotting
+MAX_SCATTER_POINTS = 4000
+
+# Radar spoke angles for the three fixed categories, closed back to the
+# first spoke; the categories never change, so computed once here
+RADAR_CATEGORIES = ('Flowrate', 'Pressure', 'Temperature')
+_angles = np.linspace(0, 2 * np.pi, len(RADAR_CATEGORIES), endpoint=False)
+RADAR_ANGLES = np.concatenate([_angles, _angles[:1]])
+del _angles
+
 
 class ChartsWidget(QWidget):
     """Enhanced widget with multiple chart types and analytics."""
@@ -22,13 +48,56 @@ class ChartsWidget(QWidget):
         super().__init__(parent)
         self.equipment = []
         self.summary = {}
+        # Column (SoA) arrays extracted once per refresh; every chart reads
+        # these instead of re-walking the equipment dicts. All three are
+        # views into one contiguous buffer that is reallocated only when
+        # the dataset outgrows it.
+        self._xyz = np.empty((3, 1024), dtype=np.float32)
+        self._flow = self._xyz[0, :0]
+        self._press = self._xyz[1, :0]
+        self._temp = self._xyz[2, :0]
+        # (flow, pressure, temperature) means and maxima, reduced once per
+        # refresh and shared by the stat cards and the radar chart
+        self._means = np.zeros(3)
+        self._maxes = np.zeros(3)
+        self._by_type = {}  # equipment_type -> flowrate array, for the boxplot
+        self._box_stats = []  # Precomputed five-number summaries for bxp
+        self._names = []  # Equipment names, extracted alongside the columns
+        self._last_stats = {}  # card key -> last text set, to skip repaints
+        # Derived statistics computed at most once per refresh, however
+        # often the correlation tab is redrawn afterwards
+        self._corr = None
+        self._trend = None
+        self._last_hash = None  # Content hash of the last drawn dataset
+        # Axes (created on first draw, then cleared and reused) and the
+        # fixed-shape artists that are updated in place across redraws
+        self.bar_ax = None
+        self.pie_ax = None
+        self.scatter_ax = None
+        self.heatmap_ax = None
+        self.box_ax = None
+        self.hist_ax = None
+        self.rank_ax = None
+        self._scatter_artist = None
+        self._scatter_trend = None
+        self._bar_flow = None  # BarContainers mutated in place on refresh
+        self._bar_press = None
+        self._heat_im = None
+        self._heat_texts = None
+        self._pie_sig = None  # type_distribution drawn in the current pie
         self._zoom_connections = []  # Store zoom event connections
-        self._tabs_rendered = [False, False, False, False]  # Track which tabs have been rendered
-        self._data_pending = False  # Track if data update is pending
+        self._dirty_tabs = set()  # Tab indices whose charts are stale
+        # Debounce bursts of update_data calls: only the last push within
+        # the quiet period is rendered
+        self._pending_data = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._do_refresh)
         self.setup_ui()
         self._setup_zoom_handlers()
         # Connect tab change for lazy loading
-        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self.tabs.currentChanged.connect(self._flush_visible)
     
     def setup_ui(self):
         """Setup UI with tabs for different chart categories."""
@@ -78,8 +147,6 @@ class ChartsWidget(QWidget):
         self.tabs.addTab(self.create_comparison_tab(), "Comparison")
         
         layout.addWidget(self.tabs)
-        
-        plt.style.use('dark_background')
     
     def create_card(self, title_text):
         """Create a styled card frame."""
@@ -153,6 +220,9 @@ class ChartsWidget(QWidget):
         # Bar chart
         bar_card, bar_layout = self.create_card("Flowrate & Pressure by Equipment")
         self.bar_figure = Figure(figsize=(6, 3.5), facecolor='#16162a')
+        # Fixed margins per figure replace the tight_layout solve that
+        # used to re-measure every artist at the end of each draw
+        self.bar_figure.subplots_adjust(left=0.08, right=0.97, top=0.95, bottom=0.28)
         self.bar_canvas = FigureCanvas(self.bar_figure)
         bar_layout.addWidget(self.bar_canvas)
         charts_layout.addWidget(bar_card, 3)
@@ -160,6 +230,7 @@ class ChartsWidget(QWidget):
         # Pie chart
         pie_card, pie_layout = self.create_card("Equipment Type Distribution")
         self.pie_figure = Figure(figsize=(3.5, 3.5), facecolor='#16162a')
+        self.pie_figure.subplots_adjust(left=0.05, right=0.95, top=0.95, bottom=0.05)
         self.pie_canvas = FigureCanvas(self.pie_figure)
         pie_layout.addWidget(self.pie_canvas)
         charts_layout.addWidget(pie_card, 2)
@@ -185,6 +256,7 @@ class ChartsWidget(QWidget):
         # Scatter plot
         scatter_card, scatter_layout = self.create_card("Temperature vs Flowrate Correlation")
         self.scatter_figure = Figure(figsize=(5, 4), facecolor='#16162a')
+        self.scatter_figure.subplots_adjust(left=0.12, right=0.98, top=0.95, bottom=0.13)
         self.scatter_canvas = FigureCanvas(self.scatter_figure)
         scatter_layout.addWidget(self.scatter_canvas)
         charts_layout.addWidget(scatter_card)
@@ -192,6 +264,7 @@ class ChartsWidget(QWidget):
         # Heatmap
         heatmap_card, heatmap_layout = self.create_card("Parameter Correlation Matrix")
         self.heatmap_figure = Figure(figsize=(4, 4), facecolor='#16162a')
+        self.heatmap_figure.subplots_adjust(left=0.24, right=0.95, top=0.95, bottom=0.12)
         self.heatmap_canvas = FigureCanvas(self.heatmap_figure)
         heatmap_layout.addWidget(self.heatmap_canvas)
         charts_layout.addWidget(heatmap_card)
@@ -209,6 +282,7 @@ class ChartsWidget(QWidget):
         # Box plot
         box_card, box_layout = self.create_card("Parameter Distribution by Equipment Type")
         self.box_figure = Figure(figsize=(6, 4), facecolor='#16162a')
+        self.box_figure.subplots_adjust(left=0.10, right=0.97, top=0.95, bottom=0.12)
         self.box_canvas = FigureCanvas(self.box_figure)
         box_layout.addWidget(self.box_canvas)
         layout.addWidget(box_card, 3)
@@ -216,6 +290,7 @@ class ChartsWidget(QWidget):
         # Histogram
         hist_card, hist_layout = self.create_card("Flowrate Distribution")
         self.hist_figure = Figure(figsize=(4, 4), facecolor='#16162a')
+        self.hist_figure.subplots_adjust(left=0.14, right=0.97, top=0.95, bottom=0.14)
         self.hist_canvas = FigureCanvas(self.hist_figure)
         hist_layout.addWidget(self.hist_canvas)
         layout.addWidget(hist_card, 2)
@@ -234,6 +309,8 @@ class ChartsWidget(QWidget):
         # Radar chart
         radar_card, radar_layout = self.create_card("Top Equipment Multi-Parameter Comparison")
         self.radar_figure = Figure(figsize=(5, 4), facecolor='#16162a')
+        # Right margin leaves room for the legend anchored outside the axes
+        self.radar_figure.subplots_adjust(left=0.05, right=0.72, top=0.92, bottom=0.08)
         self.radar_canvas = FigureCanvas(self.radar_figure)
         radar_layout.addWidget(self.radar_canvas)
         charts_layout.addWidget(radar_card)
@@ -241,6 +318,7 @@ class ChartsWidget(QWidget):
         # Rankings
         rank_card, rank_layout = self.create_card("Equipment Rankings")
         self.rank_figure = Figure(figsize=(4, 4), facecolor='#16162a')
+        self.rank_figure.subplots_adjust(left=0.26, right=0.95, top=0.95, bottom=0.14)
         self.rank_canvas = FigureCanvas(self.rank_figure)
         rank_layout.addWidget(self.rank_canvas)
         charts_layout.addWidget(rank_card)
@@ -273,7 +351,6 @@ class ChartsWidget(QWidget):
         if event.dblclick:
             for ax in figure.axes:
                 ax.autoscale()
-            figure.tight_layout(pad=1)
             canvas.draw_idle()
     
     def _on_scroll_zoom(self, event, figure, canvas):
@@ -323,124 +400,276 @@ class ChartsWidget(QWidget):
         """Reset zoom to original view."""
         for ax in figure.axes:
             ax.autoscale()
-        figure.tight_layout(pad=1)
         canvas.draw_idle()
     
     def update_data(self, equipment: list, summary: dict):
-        """Update charts with new data using lazy loading."""
+        """Update charts with new data, debounced and lazily rendered.
+
+        Consecutive pushes inside the debounce window coalesce into one
+        redraw of the last dataset, bounding the refresh rate however
+        fast the backend delivers.
+        """
+        self._pending_data = (equipment, summary)
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Apply the most recently pushed dataset to the charts."""
+        equipment, summary = self._pending_data
         self.equipment = equipment
         self.summary = summary
-        
-        # Reset rendered state
-        self._tabs_rendered = [False, False, False, False]
-        self._data_pending = True
-        
+        self._extract_columns(equipment)
+
+        # Redrawing nine figures dominates refresh cost, so skip the whole
+        # pass when the backend pushed data identical to what is on screen
+        content_hash = hash((
+            self._flow.tobytes(),
+            self._press.tobytes(),
+            self._temp.tobytes(),
+            tuple(sorted(summary.get('type_distribution', {}).items())),
+        ))
+        if content_hash == self._last_hash:
+            return
+        self._last_hash = content_hash
+        self._corr = None
+        self._trend = None
+
+        # Invalidate every tab, but only draw the one on screen; the
+        # other three render when the user switches to them
+        self._dirty_tabs = {0, 1, 2, 3}
+
         # Always update stats immediately (they're lightweight)
         self.update_stats()
-        
-        # Only render the current visible tab immediately
-        self._render_current_tab()
-    
-    def _on_tab_changed(self, index):
-        """Handle tab change - render if not yet rendered."""
-        if self._data_pending and not self._tabs_rendered[index]:
-            self._render_tab(index)
-    
-    def _render_current_tab(self):
-        """Render charts for the current tab."""
-        current_idx = self.tabs.currentIndex()
-        self._render_tab(current_idx)
-    
-    def _render_tab(self, index):
-        """Render charts for a specific tab."""
-        if self._tabs_rendered[index]:
+
+        # Hold tab repaints while the visible charts rebuild so the tab
+        # area paints once at the end instead of per intermediate state
+        self.tabs.setUpdatesEnabled(False)
+        try:
+            self._flush_visible()
+        finally:
+            self.tabs.setUpdatesEnabled(True)
+            self.tabs.update()
+
+    def _flush_visible(self, index=None):
+        """Draw the visible tab's charts if they are stale."""
+        # While the whole widget is hidden there is nothing to paint;
+        # the tabs stay dirty and showEvent flushes them on reveal
+        if not self.isVisible():
             return
-        
-        self._tabs_rendered[index] = True
-        
-        if index == 0:  # Overview
-            self.draw_bar()
-            self.draw_pie()
-        elif index == 1:  # Correlations
-            self.draw_scatter()
-            self.draw_heatmap()
-        elif index == 2:  # Distributions
-            self.draw_boxplot()
-            self.draw_histogram()
-        elif index == 3:  # Comparison
-            self.draw_radar()
-            self.draw_rankings()
+        if index is None:
+            index = self.tabs.currentIndex()
+        if index not in self._dirty_tabs:
+            return
+
+        self._dirty_tabs.discard(index)
+
+        first, second = (
+            (self.draw_bar, self.draw_pie),          # Overview
+            (self.draw_scatter, self.draw_heatmap),  # Correlations
+            (self.draw_boxplot, self.draw_histogram),  # Distributions
+            (self.draw_radar, self.draw_rankings),   # Comparison
+        )[index]
+
+        # Render the second figure on the next event-loop pass so input
+        # events are processed between the two draws; matplotlib figures
+        # can't be rendered from a worker thread, but splitting the work
+        # this way halves the longest uninterrupted GUI stall
+        first()
+        QTimer.singleShot(0, second)
     
+    def _extract_columns(self, equipment: list):
+        """Build the per-field NumPy arrays every chart reads.
+
+        Extracting each field once here replaces up to nine list
+        comprehensions over the equipment dicts per refresh, and the
+        contiguous arrays feed mean/correlation/argsort without
+        conversion. This single loop is also where a pandas.DataFrame
+        round trip was considered and rejected: the frontend does not
+        depend on pandas, and frame construction plus to_numpy would
+        allocate more than it saves at the row counts the API returns.
+        """
+        n = len(equipment)
+        if n > self._xyz.shape[1]:
+            # Grow with headroom so steadily larger uploads don't
+            # reallocate every refresh
+            self._xyz = np.empty(
+                (3, max(2 * self._xyz.shape[1], n)), dtype=np.float32
+            )
+
+        xyz = self._xyz
+        for i, eq in enumerate(equipment):
+            xyz[0, i] = float(eq.get('flowrate', 0) or 0)
+            xyz[1, i] = float(eq.get('pressure', 0) or 0)
+            xyz[2, i] = float(eq.get('temperature', 0) or 0)
+
+        self._flow = xyz[0, :n]
+        self._press = xyz[1, :n]
+        self._temp = xyz[2, :n]
+        # Labels come along in the same refresh; the charts truncate only
+        # the handful of names they actually display
+        self._names = [str(eq.get('name') or '') for eq in equipment]
+        if n:
+            columns = (self._flow, self._press, self._temp)
+            self._means = np.array([col.mean() for col in columns])
+            self._maxes = np.array([col.max() for col in columns])
+        else:
+            self._means = np.zeros(3)
+            self._maxes = np.zeros(3)
+
+        # Group flowrates by type here so the boxplot redraw is a lookup
+        by_type = defaultdict(list)
+        for eq, flowrate in zip(equipment, self._flow):
+            by_type[eq.get('equipment_type', 'Other')].append(flowrate)
+        self._by_type = {
+            eq_type: np.asarray(values) for eq_type, values in by_type.items()
+        }
+
+        # Five-number summaries per type, ready for Axes.bxp: the quartile
+        # math runs here once instead of inside ax.boxplot on every draw
+        self._box_stats = []
+        for eq_type, values in self._by_type.items():
+            mn, q1, med, q3, mx = np.percentile(values, [0, 25, 50, 75, 100])
+            self._box_stats.append({
+                'label': eq_type[:6],
+                'whislo': mn, 'q1': q1, 'med': med, 'q3': q3, 'whishi': mx,
+                'fliers': [],
+            })
+
+    def _get_axes(self, figure, attr):
+        """Return the figure's single Axes, creating it on first use.
+
+        Clearing and reusing one Axes is much cheaper than the old
+        figure.clear() + add_subplot pair, which rebuilt every tick,
+        spine and label artist on each redraw.
+        """
+        ax = getattr(self, attr)
+        if ax is None:
+            ax = figure.add_subplot(111)
+            setattr(self, attr, ax)
+        else:
+            ax.clear()
+        ax.set_facecolor('#16162a')
+        return ax
+
+    def _top_k_by_flow(self, k):
+        """Indices of the k largest flowrates, in descending order.
+
+        argpartition selects the top k in O(n); only those k entries are
+        then sorted, instead of sorting the whole equipment list.
+        """
+        if len(self._flow) <= k:
+            return np.argsort(-self._flow)
+        idx = np.argpartition(-self._flow, k)[:k]
+        return idx[np.argsort(-self._flow[idx])]
+
     def update_stats(self):
-        """Update statistics cards."""
+        """Update statistics cards, touching only the labels that changed."""
         if not self.equipment:
             return
-        
-        flowrates = [float(eq.get('flowrate', 0) or 0) for eq in self.equipment]
-        pressures = [float(eq.get('pressure', 0) or 0) for eq in self.equipment]
-        temps = [float(eq.get('temperature', 0) or 0) for eq in self.equipment]
-        
-        self.stat_cards['count'].setText(str(len(self.equipment)))
-        self.stat_cards['avg_flow'].setText(f"{np.mean(flowrates):.1f}")
-        self.stat_cards['max_pressure'].setText(f"{np.max(pressures):.1f}")
-        self.stat_cards['avg_temp'].setText(f"{np.mean(temps):.1f}°")
-        
+
+        means, maxes = self._means, self._maxes
+
         # Calculate efficiency score (normalized composite)
-        if flowrates and pressures:
-            norm_flow = np.mean(flowrates) / max(flowrates) if max(flowrates) > 0 else 0
-            norm_press = np.mean(pressures) / max(pressures) if max(pressures) > 0 else 0
-            efficiency = (norm_flow + norm_press) / 2 * 100
-            self.stat_cards['efficiency'].setText(f"{efficiency:.0f}%")
+        norm_flow = means[0] / maxes[0] if maxes[0] > 0 else 0
+        norm_press = means[1] / maxes[1] if maxes[1] > 0 else 0
+        efficiency = (norm_flow + norm_press) / 2 * 100
+
+        texts = {
+            'count': str(len(self.equipment)),
+            'avg_flow': f"{means[0]:.1f}",
+            'max_pressure': f"{maxes[1]:.1f}",
+            'avg_temp': f"{means[2]:.1f}°",
+            'efficiency': f"{efficiency:.0f}%",
+        }
+        # setText triggers a relayout/repaint even for identical strings,
+        # so compare against the last rendered values first
+        self.setUpdatesEnabled(False)
+        try:
+            for key, text in texts.items():
+                if self._last_stats.get(key) != text:
+                    self.stat_cards[key].setText(text)
+            self._last_stats = texts
+        finally:
+            self.setUpdatesEnabled(True)
     
+    # The bar chart compares at most this many pieces of equipment
+    BAR_SLOTS = 8
+
     def draw_bar(self):
         """Draw bar chart."""
-        self.bar_figure.clear()
-        ax = self.bar_figure.add_subplot(111)
-        ax.set_facecolor('#16162a')
-        
         if not self.equipment:
-            ax.text(0.5, 0.5, 'No data available', ha='center', va='center', 
+            self._bar_flow = None
+            self._bar_press = None
+            ax = self._get_axes(self.bar_figure, 'bar_ax')
+            ax.text(0.5, 0.5, 'No data available', ha='center', va='center',
                    color='#606080', fontsize=11)
             ax.axis('off')
-            self.bar_canvas.draw()
+            self.bar_canvas.draw_idle()
             return
-        
-        data = self.equipment[:8]
-        names = [eq.get('name', '')[:10] for eq in data]
-        flowrates = [float(eq.get('flowrate', 0) or 0) for eq in data]
-        pressures = [float(eq.get('pressure', 0) or 0) for eq in data]
-        
-        x = np.arange(len(names))
-        w = 0.35
-        
-        ax.bar(x - w/2, flowrates, w, label='Flowrate', color='#7c3aed', alpha=0.9)
-        ax.bar(x + w/2, pressures, w, label='Pressure', color='#06b6d4', alpha=0.9)
-        
-        ax.set_xticks(x)
+
+        names = [name[:10] for name in self._names[:self.BAR_SLOTS]]
+        flowrates = self._flow[:self.BAR_SLOTS]
+        pressures = self._press[:self.BAR_SLOTS]
+        n = len(names)
+
+        if self._bar_flow is None:
+            # Build a fixed bank of bar rectangles once; refreshes only
+            # adjust heights and visibility, so no artists, legend or
+            # styling are reconstructed per redraw
+            ax = self._get_axes(self.bar_figure, 'bar_ax')
+            x = np.arange(self.BAR_SLOTS)
+            w = 0.35
+            zeros = np.zeros(self.BAR_SLOTS)
+
+            self._bar_flow = ax.bar(x - w/2, zeros, w, label='Flowrate',
+                                    color='#7c3aed', alpha=0.9)
+            self._bar_press = ax.bar(x + w/2, zeros, w, label='Pressure',
+                                     color='#06b6d4', alpha=0.9)
+
+            ax.tick_params(colors='#606080', labelsize=8)
+            ax.legend(loc='upper right', facecolor='#1e1e38', edgecolor='#303050',
+                     labelcolor='#e0e0e0', fontsize=8)
+
+            for spine in ax.spines.values():
+                spine.set_color('#303050')
+            ax.grid(True, alpha=0.1, color='#ffffff', axis='y')
+        else:
+            ax = self.bar_ax
+
+        for i, (flow_rect, press_rect) in enumerate(
+                zip(self._bar_flow.patches, self._bar_press.patches)):
+            visible = i < n
+            flow_rect.set_visible(visible)
+            press_rect.set_visible(visible)
+            flow_rect.set_height(flowrates[i] if visible else 0)
+            press_rect.set_height(pressures[i] if visible else 0)
+
+        ax.set_xticks(np.arange(n))
         ax.set_xticklabels(names, rotation=45, ha='right', fontsize=8, color='#8080a0')
-        ax.tick_params(colors='#606080', labelsize=8)
-        ax.legend(loc='upper right', facecolor='#1e1e38', edgecolor='#303050', 
-                 labelcolor='#e0e0e0', fontsize=8)
-        
-        for spine in ax.spines.values():
-            spine.set_color('#303050')
-        ax.grid(True, alpha=0.1, color='#ffffff', axis='y')
-        
-        self.bar_figure.tight_layout(pad=1)
-        self.bar_canvas.draw()
+        # Scale to the visible bars by hand; autoscale_view would include
+        # the hidden placeholder rectangles
+        ax.set_xlim(-0.6, n - 0.4)
+        top = float(max(flowrates.max(), pressures.max())) * 1.05 or 1.0
+        ax.set_ylim(0, top)
+
+        self.bar_canvas.draw_idle()
     
     def draw_pie(self):
         """Draw pie chart."""
-        self.pie_figure.clear()
-        ax = self.pie_figure.add_subplot(111)
-        ax.set_facecolor('#16162a')
-        
         dist = self.summary.get('type_distribution', {})
-        
+
+        # The type mix usually survives a refresh even when the numeric
+        # columns change; skip the wedge layout entirely in that case
+        sig = tuple(sorted(dist.items()))
+        if sig == self._pie_sig:
+            return
+        self._pie_sig = sig
+
+        ax = self._get_axes(self.pie_figure, 'pie_ax')
+
         if not dist:
             ax.text(0.5, 0.5, 'No data', ha='center', va='center', color='#606080')
             ax.axis('off')
-            self.pie_canvas.draw()
+            self.pie_canvas.draw_idle()
             return
         
         labels = list(dist.keys())
@@ -458,121 +687,171 @@ class ChartsWidget(QWidget):
             autotext.set_color('#16162a')
             autotext.set_fontweight('bold')
         
-        self.pie_figure.tight_layout(pad=0.5)
-        self.pie_canvas.draw()
+        self.pie_canvas.draw_idle()
     
     def draw_scatter(self):
         """Draw scatter plot showing correlation."""
-        self.scatter_figure.clear()
-        ax = self.scatter_figure.add_subplot(111)
-        ax.set_facecolor('#16162a')
-        
         if not self.equipment:
+            if self._scatter_artist is not None:
+                # Drop the colorbar axes together with the stale artists
+                self.scatter_figure.clear()
+                self.scatter_ax = None
+                self._scatter_artist = None
+            ax = self._get_axes(self.scatter_figure, 'scatter_ax')
             ax.text(0.5, 0.5, 'No data', ha='center', va='center', color='#606080')
             ax.axis('off')
-            self.scatter_canvas.draw()
+            self.scatter_canvas.draw_idle()
             return
-        
-        temps = [float(eq.get('temperature', 0) or 0) for eq in self.equipment]
-        flowrates = [float(eq.get('flowrate', 0) or 0) for eq in self.equipment]
-        pressures = [float(eq.get('pressure', 0) or 0) for eq in self.equipment]
-        
+
+        temps = self._temp
+        flowrates = self._flow
+        pressures = self._press
+
+        # Render at most MAX_SCATTER_POINTS markers: past a few thousand,
+        # extra points only overdraw the same pixels. Stride decimation is
+        # used (rather than pixel-bin min/max aggregation) because the
+        # scatter x values are unordered samples, not a time series. The
+        # trend line and axis limits still use the full arrays.
+        n = len(temps)
+        if n > MAX_SCATTER_POINTS:
+            sel = np.arange(0, n, n // MAX_SCATTER_POINTS + 1)
+            plot_t, plot_f, plot_p = temps[sel], flowrates[sel], pressures[sel]
+        else:
+            plot_t, plot_f, plot_p = temps, flowrates, pressures
+
         # Size based on pressure
-        sizes = [p * 8 for p in pressures]
-        
-        scatter = ax.scatter(temps, flowrates, s=sizes, c=pressures, 
-                            cmap='viridis', alpha=0.7, edgecolors='white', linewidth=0.5)
-        
-        # Trend line
-        if len(temps) > 1:
-            z = np.polyfit(temps, flowrates, 1)
-            p = np.poly1d(z)
-            ax.plot(temps, p(temps), '--', color='#f59e0b', alpha=0.7, linewidth=2)
-        
-        ax.set_xlabel('Temperature', color='#8080a0', fontsize=10)
-        ax.set_ylabel('Flowrate', color='#8080a0', fontsize=10)
-        ax.tick_params(colors='#606080', labelsize=9)
-        
-        for spine in ax.spines.values():
-            spine.set_color('#303050')
-        
-        # Colorbar
-        cbar = self.scatter_figure.colorbar(scatter, ax=ax, shrink=0.8)
-        cbar.set_label('Pressure', color='#8080a0', fontsize=9)
-        cbar.ax.tick_params(colors='#606080', labelsize=8)
-        
-        self.scatter_figure.tight_layout(pad=1)
-        self.scatter_canvas.draw()
+        sizes = plot_p * 8
+
+        if self._scatter_artist is None:
+            # Build the artists once; later refreshes only push new data
+            # into them instead of reconstructing collection, trend line,
+            # labels and colorbar
+            ax = self._get_axes(self.scatter_figure, 'scatter_ax')
+            self._scatter_artist = ax.scatter(
+                plot_t, plot_f, s=sizes, c=plot_p,
+                cmap='viridis', alpha=0.7, edgecolors='white', linewidth=0.5
+            )
+            self._scatter_trend, = ax.plot(
+                [], [], '--', color='#f59e0b', alpha=0.7, linewidth=2
+            )
+
+            ax.set_xlabel('Temperature', color='#8080a0', fontsize=10)
+            ax.set_ylabel('Flowrate', color='#8080a0', fontsize=10)
+            ax.tick_params(colors='#606080', labelsize=9)
+
+            for spine in ax.spines.values():
+                spine.set_color('#303050')
+
+            # Colorbar
+            cbar = self.scatter_figure.colorbar(self._scatter_artist, ax=ax, shrink=0.8)
+            cbar.set_label('Pressure', color='#8080a0', fontsize=9)
+            cbar.ax.tick_params(colors='#606080', labelsize=8)
+        else:
+            ax = self.scatter_ax
+            self._scatter_artist.set_offsets(np.c_[plot_t, plot_f])
+            self._scatter_artist.set_sizes(sizes)
+            self._scatter_artist.set_array(plot_p)
+            self._scatter_artist.set_clim(plot_p.min(), plot_p.max())
+
+        # Trend line: degree-1 least squares in closed form — two dot
+        # products instead of np.polyfit's Vandermonde/SVD machinery, and
+        # two endpoints instead of N redundant line vertices. Fitted at
+        # most once per refresh.
+        if self._trend is None:
+            dt = temps - temps.mean()
+            denom = (dt ** 2).sum()
+            if len(temps) > 1 and denom > 0:
+                slope = (dt * (flowrates - flowrates.mean())).sum() / denom
+                self._trend = (slope, flowrates.mean() - slope * temps.mean())
+            else:
+                self._trend = ()
+        if self._trend:
+            slope, intercept = self._trend
+            x0, x1 = temps.min(), temps.max()
+            self._scatter_trend.set_data(
+                [x0, x1], [intercept + slope * x0, intercept + slope * x1]
+            )
+        else:
+            self._scatter_trend.set_data([], [])
+
+        xpad = (temps.max() - temps.min()) * 0.05 or 1.0
+        ypad = (flowrates.max() - flowrates.min()) * 0.05 or 1.0
+        ax.set_xlim(temps.min() - xpad, temps.max() + xpad)
+        ax.set_ylim(flowrates.min() - ypad, flowrates.max() + ypad)
+
+        self.scatter_canvas.draw_idle()
     
     def draw_heatmap(self):
         """Draw correlation heatmap."""
-        self.heatmap_figure.clear()
-        ax = self.heatmap_figure.add_subplot(111)
-        ax.set_facecolor('#16162a')
-        
         if not self.equipment or len(self.equipment) < 2:
+            if self._heat_im is not None:
+                self.heatmap_figure.clear()
+                self.heatmap_ax = None
+                self._heat_im = None
+            ax = self._get_axes(self.heatmap_figure, 'heatmap_ax')
             ax.text(0.5, 0.5, 'Need more data', ha='center', va='center', color='#606080')
             ax.axis('off')
-            self.heatmap_canvas.draw()
+            self.heatmap_canvas.draw_idle()
             return
-        
-        flowrates = [float(eq.get('flowrate', 0) or 0) for eq in self.equipment]
-        pressures = [float(eq.get('pressure', 0) or 0) for eq in self.equipment]
-        temps = [float(eq.get('temperature', 0) or 0) for eq in self.equipment]
-        
-        data = np.array([flowrates, pressures, temps])
-        corr = np.corrcoef(data)
-        
-        labels = ['Flowrate', 'Pressure', 'Temperature']
-        im = ax.imshow(corr, cmap='RdYlGn', vmin=-1, vmax=1)
-        
-        ax.set_xticks(range(3))
-        ax.set_yticks(range(3))
-        ax.set_xticklabels(labels, fontsize=9, color='#8080a0')
-        ax.set_yticklabels(labels, fontsize=9, color='#8080a0')
-        
-        # Add correlation values
+
+        # Pearson correlation as one small matmul: center each row, scale
+        # to unit norm, then Z @ Z.T is the 3x3 correlation matrix without
+        # np.corrcoef's intermediate covariance/outer-product allocations.
+        # Computed at most once per refresh.
+        if self._corr is None:
+            Z = np.stack([self._flow, self._press, self._temp])
+            Z -= Z.mean(axis=1, keepdims=True)
+            norms = np.linalg.norm(Z, axis=1, keepdims=True)
+            Z /= np.where(norms == 0, 1, norms)
+            self._corr = Z @ Z.T
+        corr = self._corr
+
+        if self._heat_im is None:
+            # The heatmap has a fixed 3x3 shape, so image, tick labels,
+            # value texts and colorbar are created once and refreshed
+            # in place afterwards
+            ax = self._get_axes(self.heatmap_figure, 'heatmap_ax')
+            labels = ['Flowrate', 'Pressure', 'Temperature']
+            self._heat_im = ax.imshow(corr, cmap='RdYlGn', vmin=-1, vmax=1)
+
+            ax.set_xticks(range(3))
+            ax.set_yticks(range(3))
+            ax.set_xticklabels(labels, fontsize=9, color='#8080a0')
+            ax.set_yticklabels(labels, fontsize=9, color='#8080a0')
+
+            self._heat_texts = [
+                [
+                    ax.text(j, i, '', ha='center', va='center',
+                            fontsize=10, fontweight='bold')
+                    for j in range(3)
+                ]
+                for i in range(3)
+            ]
+
+            self.heatmap_figure.colorbar(self._heat_im, ax=ax, shrink=0.8)
+        else:
+            self._heat_im.set_data(corr)
+
+        # Refresh correlation values
         for i in range(3):
             for j in range(3):
-                text_color = '#16162a' if abs(corr[i, j]) > 0.5 else '#e0e0e0'
-                ax.text(j, i, f'{corr[i, j]:.2f}', ha='center', va='center', 
-                       color=text_color, fontsize=10, fontweight='bold')
-        
-        self.heatmap_figure.colorbar(im, ax=ax, shrink=0.8)
-        self.heatmap_figure.tight_layout(pad=1)
-        self.heatmap_canvas.draw()
+                text = self._heat_texts[i][j]
+                text.set_text(f'{corr[i, j]:.2f}')
+                text.set_color('#16162a' if abs(corr[i, j]) > 0.5 else '#e0e0e0')
+
+        self.heatmap_canvas.draw_idle()
     
     def draw_boxplot(self):
         """Draw box plot by equipment type."""
-        self.box_figure.clear()
-        ax = self.box_figure.add_subplot(111)
-        ax.set_facecolor('#16162a')
-        
+        ax = self._get_axes(self.box_figure, 'box_ax')
+
         if not self.equipment:
             ax.text(0.5, 0.5, 'No data', ha='center', va='center', color='#606080')
             ax.axis('off')
-            self.box_canvas.draw()
-            return
-        
-        # Group by type
-        type_data = {}
-        for eq in self.equipment:
-            eq_type = eq.get('equipment_type', 'Other')
-            if eq_type not in type_data:
-                type_data[eq_type] = []
-            type_data[eq_type].append(float(eq.get('flowrate', 0) or 0))
-        
-        if not type_data:
-            ax.text(0.5, 0.5, 'No data', ha='center', va='center', color='#606080')
-            ax.axis('off')
-            self.box_canvas.draw()
+            self.box_canvas.draw_idle()
             return
         
-        # Shorten labels
-        labels = [k[:6] for k in type_data.keys()]
-        data = list(type_data.values())
-        
-        bp = ax.boxplot(data, labels=labels, patch_artist=True)
+        bp = ax.bxp(self._box_stats, patch_artist=True, showfliers=False)
         
         colors = ['#7c3aed', '#8b5cf6', '#059669', '#f59e0b', '#ef4444', '#06b6d4']
         for patch, color in zip(bp['boxes'], colors):
@@ -585,42 +864,51 @@ class ChartsWidget(QWidget):
         
         ax.set_ylabel('Flowrate', color='#a0a0c0', fontsize=9)
         ax.tick_params(colors='#606080', labelsize=8)
-        plt.setp(ax.get_xticklabels(), rotation=0, ha='center', color='#a0a0c0', fontsize=8)
+        # Style the tick labels directly; plt.setp routes through pyplot's
+        # property-introspection machinery for what is four setters per label
+        for label in ax.get_xticklabels():
+            label.set(rotation=0, ha='center', color='#a0a0c0', fontsize=8)
         ax.grid(True, alpha=0.1, axis='y', color='#ffffff')
         
         for spine in ax.spines.values():
             spine.set_color('#303050')
         
-        self.box_figure.tight_layout(pad=1.2)
-        self.box_canvas.draw()
+        self.box_canvas.draw_idle()
     
     def draw_histogram(self):
         """Draw flowrate histogram with smooth look."""
-        self.hist_figure.clear()
-        ax = self.hist_figure.add_subplot(111)
-        ax.set_facecolor('#16162a')
-        
+        ax = self._get_axes(self.hist_figure, 'hist_ax')
+
         if not self.equipment:
             ax.text(0.5, 0.5, 'No data', ha='center', va='center', color='#606080')
             ax.axis('off')
-            self.hist_canvas.draw()
+            self.hist_canvas.draw_idle()
             return
         
-        flowrates = [float(eq.get('flowrate', 0) or 0) for eq in self.equipment]
-        
-        # Better binning
+        flowrates = self._flow
+
+        # Better binning; bin in NumPy and hand matplotlib the final bars,
+        # skipping ax.hist's per-dataset preprocessing
         n_bins = min(10, max(5, len(flowrates) // 2))
-        n, bins, patches = ax.hist(flowrates, bins=n_bins, color='#7c3aed', 
-                                   alpha=0.85, edgecolor='#0f0f1a', linewidth=1.5,
-                                   rwidth=0.85)
-        
-        # Gradient effect on bars
-        for i, patch in enumerate(patches):
-            brightness = 0.7 + (i / len(patches)) * 0.3
-            patch.set_facecolor((0.486 * brightness, 0.227 * brightness, 0.929 * brightness, 0.9))
-        
+        counts, bins = np.histogram(flowrates, bins=n_bins)
+        width = (bins[1] - bins[0]) * 0.85
+
+        # Gradient effect, computed as one RGBA matrix handed straight to
+        # bar() instead of recoloring every patch in a Python loop
+        brightness = 0.7 + np.arange(n_bins) / n_bins * 0.3
+        rgba = np.stack([
+            0.486 * brightness,
+            0.227 * brightness,
+            0.929 * brightness,
+            np.full(n_bins, 0.9),
+        ], axis=1)
+        ax.bar(
+            (bins[:-1] + bins[1:]) / 2, counts, width=width, color=rgba,
+            edgecolor='#0f0f1a', linewidth=1.5
+        )
+
         # Add mean line
-        mean_val = np.mean(flowrates)
+        mean_val = flowrates.mean()
         ax.axvline(mean_val, color='#f59e0b', linestyle='--', linewidth=2, label=f'Mean: {mean_val:.0f}')
         
         ax.set_xlabel('Flowrate', color='#8080a0', fontsize=10)
@@ -632,76 +920,70 @@ class ChartsWidget(QWidget):
         for spine in ax.spines.values():
             spine.set_color('#303050')
         
-        self.hist_figure.tight_layout(pad=1)
-        self.hist_canvas.draw()
+        self.hist_canvas.draw_idle()
     
     def draw_radar(self):
         """Draw radar chart for top equipment."""
+        # The radar swaps between a polar and a plain axes depending on
+        # data, so this figure keeps the clear-and-rebuild approach
         self.radar_figure.clear()
-        
+
         if not self.equipment or len(self.equipment) < 2:
             ax = self.radar_figure.add_subplot(111)
             ax.set_facecolor('#16162a')
             ax.text(0.5, 0.5, 'Need more data', ha='center', va='center', color='#606080')
             ax.axis('off')
-            self.radar_canvas.draw()
+            self.radar_canvas.draw_idle()
             return
         
         # Get top 3 equipment by flowrate
-        sorted_eq = sorted(self.equipment, key=lambda x: float(x.get('flowrate', 0) or 0), reverse=True)[:3]
-        
-        categories = ['Flowrate', 'Pressure', 'Temperature']
-        N = len(categories)
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        angles += angles[:1]  # Complete the loop
-        
+        top_idx = self._top_k_by_flow(3)
+
+        angles = RADAR_ANGLES
+
         ax = self.radar_figure.add_subplot(111, polar=True)
         ax.set_facecolor('#16162a')
         
         colors = ['#7c3aed', '#06b6d4', '#f59e0b']
         
-        # Normalize values
-        max_flow = max(float(eq.get('flowrate', 1) or 1) for eq in self.equipment)
-        max_press = max(float(eq.get('pressure', 1) or 1) for eq in self.equipment)
-        max_temp = max(float(eq.get('temperature', 1) or 1) for eq in self.equipment)
-        
-        for i, eq in enumerate(sorted_eq):
-            values = [
-                float(eq.get('flowrate', 0) or 0) / max_flow,
-                float(eq.get('pressure', 0) or 0) / max_press,
-                float(eq.get('temperature', 0) or 0) / max_temp
-            ]
-            values += values[:1]
-            
-            ax.plot(angles, values, 'o-', linewidth=2, color=colors[i], label=eq.get('name', '')[:8])
+        # Normalize the top-k rows against the column maxima in one
+        # broadcast divide, and close each polygon by repeating the first
+        # column, instead of dividing field-by-field per equipment
+        maxvec = np.where(self._maxes == 0, 1, self._maxes)
+        M = np.stack(
+            [self._flow[top_idx], self._press[top_idx], self._temp[top_idx]],
+            axis=1
+        ) / maxvec
+        M = np.hstack([M, M[:, :1]])
+
+        for i, (idx, values) in enumerate(zip(top_idx, M)):
+            name = self._names[idx][:8]
+            ax.plot(angles, values, 'o-', linewidth=2, color=colors[i], label=name)
             ax.fill(angles, values, alpha=0.25, color=colors[i])
         
         ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(categories, color='#8080a0', fontsize=9)
+        ax.set_xticklabels(RADAR_CATEGORIES, color='#8080a0', fontsize=9)
         ax.tick_params(colors='#606080')
         ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1), facecolor='#1e1e38', 
                  edgecolor='#303050', labelcolor='#e0e0e0', fontsize=8)
         
-        self.radar_figure.tight_layout(pad=1)
-        self.radar_canvas.draw()
+        self.radar_canvas.draw_idle()
     
     def draw_rankings(self):
         """Draw horizontal bar chart rankings."""
-        self.rank_figure.clear()
-        ax = self.rank_figure.add_subplot(111)
-        ax.set_facecolor('#16162a')
-        
+        ax = self._get_axes(self.rank_figure, 'rank_ax')
+
         if not self.equipment:
             ax.text(0.5, 0.5, 'No data', ha='center', va='center', color='#606080')
             ax.axis('off')
-            self.rank_canvas.draw()
+            self.rank_canvas.draw_idle()
             return
         
         # Sort by flowrate
-        sorted_eq = sorted(self.equipment, key=lambda x: float(x.get('flowrate', 0) or 0), reverse=True)[:6]
-        
-        names = [eq.get('name', '')[:12] for eq in sorted_eq]
-        values = [float(eq.get('flowrate', 0) or 0) for eq in sorted_eq]
+        top_idx = self._top_k_by_flow(6)
+
+        names = [self._names[i][:12] for i in top_idx]
+        values = self._flow[top_idx]
         
         colors = ['#7c3aed', '#8b5cf6', '#a78bfa', '#c4b5fd', '#ddd6fe', '#ede9fe']
         
@@ -721,5 +1003,21 @@ class ChartsWidget(QWidget):
         for spine in ax.spines.values():
             spine.set_color('#303050')
         
-        self.rank_figure.tight_layout(pad=1)
-        self.rank_canvas.draw()
+        self.rank_canvas.draw_idle()
+
+    def showEvent(self, event):
+        """Catch up on redraws that were skipped while hidden."""
+        super().showEvent(event)
+        self._flush_visible()
+
+    def closeEvent(self, event):
+        """Disconnect mpl event handlers so closed widgets can be collected.
+
+        The zoom callbacks close over self; leaving them registered on the
+        canvases keeps the whole widget (and its figures) alive after
+        close, which shows up as a slow leak when views are reopened.
+        """
+        for canvas, cid in self._zoom_connections:
+            canvas.mpl_disconnect(cid)
+        self._zoom_connections.clear()
+        super().closeEvent(event)
@@ -3,31 +3,60 @@ Login/Register Dialog with Sliding Animation for Chemical Equipment Visualizer.
 """
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-    QMessageBox, QFrame, QStackedWidget, QWidget, QGraphicsDropShadowEffect
+    QMessageBox, QFrame, QStackedWidget, QWidget
 )
 from PyQt5.QtCore import (
-    Qt, QPropertyAnimation, QPoint, QEasingCurve, QTimer, pyqtProperty, 
-    QThread, pyqtSignal, QParallelAnimationGroup, QRect
+    Qt, QPoint, QEasingCurve, QTimer,
+    QObject, QRunnable, QThreadPool, pyqtSignal, QRect,
+    QVariantAnimation
 )
 from PyQt5.QtGui import QFont, QPainter, QColor, QRadialGradient, QBrush
 
+# Dialog fonts, resolved through the font matcher once per process rather
+# than on every dialog construction. Built lazily because QFont needs a
+# QApplication to exist first.
+_FONTS = None
 
-class AuthThread(QThread):
-    """Background thread for authentication to prevent UI blocking."""
+
+def _shared_fonts():
+    """Return the (icon, title, subtitle) fonts, creating them on first use."""
+    global _FONTS
+    if _FONTS is None:
+        _FONTS = (
+            QFont("Segoe UI Emoji", 36),
+            QFont("Segoe UI", 18, QFont.Bold),
+            QFont("Segoe UI", 14, QFont.Bold),
+        )
+    return _FONTS
+
+
+class _AuthSignals(QObject):
+    """Signal holder for AuthRunnable (QRunnable cannot emit directly)."""
     success = pyqtSignal(dict)
     error = pyqtSignal(str)
-    
+
+
+class AuthRunnable(QRunnable):
+    """Pooled authentication task to prevent UI blocking.
+
+    Runs on the global QThreadPool instead of a freshly spawned QThread
+    per attempt, which avoids thread startup/teardown on every retry and
+    the dangling-thread window the old thread-per-login pattern left
+    between attempts.
+    """
+
     def __init__(self, api_client, action, **kwargs):
         super().__init__()
         self.api_client = api_client
         self.action = action  # 'login' or 'register'
         self.kwargs = kwargs
-    
+        self.signals = _AuthSignals()
+
     def run(self):
         try:
             if self.action == 'login':
                 data = self.api_client.login(
-                    self.kwargs['username'], 
+                    self.kwargs['username'],
                     self.kwargs['password']
                 )
             else:
@@ -37,9 +66,9 @@ class AuthThread(QThread):
                     self.kwargs['password'],
                     self.kwargs['confirm_password']
                 )
-            self.success.emit(data)
+            self.signals.success.emit(data)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class GlassRippleButton(QPushButton):
@@ -51,43 +80,64 @@ class GlassRippleButton(QPushButton):
         self._ripple_opacity = 0
         self._ripple_pos = QPoint(0, 0)
         
-        self._radius_anim = QPropertyAnimation(self, b"ripple_radius")
-        self._radius_anim.setDuration(400)
-        self._radius_anim.setEasingCurve(QEasingCurve.OutCubic)
-        
-        self._opacity_anim = QPropertyAnimation(self, b"ripple_opacity")
-        self._opacity_anim.setDuration(400)
-        self._opacity_anim.setEasingCurve(QEasingCurve.OutCubic)
-    
-    @pyqtProperty(int)
-    def ripple_radius(self):
-        return self._ripple_radius
-    
-    @ripple_radius.setter
-    def ripple_radius(self, value):
-        self._ripple_radius = value
-        self.update()
-    
-    @pyqtProperty(int)
-    def ripple_opacity(self):
-        return self._ripple_opacity
-    
-    @ripple_opacity.setter
-    def ripple_opacity(self, value):
-        self._ripple_opacity = value
+        self._ripple_max_radius = 0
+
+        # One phase animation drives both radius and opacity: a single
+        # timer to service and one Python callback per frame, instead of
+        # two property animations each invoking their own setter
+        self._ripple_anim = QVariantAnimation(self)
+        self._ripple_anim.setDuration(400)
+        self._ripple_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._ripple_anim.setStartValue(0.0)
+        self._ripple_anim.setEndValue(1.0)
+        self._ripple_anim.valueChanged.connect(self._on_ripple_tick)
+        self._ripple_anim.finished.connect(self._on_ripple_done)
+
+        # Gradient and brush are allocated once; paintEvent only moves the
+        # gradient and refreshes its stops instead of rebuilding five Qt
+        # objects per animation tick
+        self._gradient = QRadialGradient(0, 0, 1)
+        self._brush = QBrush(self._gradient)
+
+    def _ripple_rect(self):
+        """Bounding rect of the current ripple, with antialiasing slack."""
+        r = self._ripple_radius + 4
+        return QRect(self._ripple_pos.x() - r, self._ripple_pos.y() - r,
+                     2 * r, 2 * r).intersected(self.rect())
+
+    def _on_ripple_tick(self, phase):
+        """Derive radius and opacity from the animation phase."""
+        radius = int(phase * self._ripple_max_radius)
+        opacity = int(120 * (1.0 - phase))
+        # Rounding can deliver the same ints on consecutive ticks;
+        # nothing on screen changes then
+        if radius == self._ripple_radius and opacity == self._ripple_opacity:
+            return
+        self._ripple_radius = radius
+        self._ripple_opacity = opacity
+        # Invalidate only the ripple's bounding circle, not the whole
+        # button, so each animation tick repaints the minimum region.
+        # update() lets Qt coalesce pending regions into one paint event;
+        # repaint() would force a synchronous paint per tick instead.
+        self.update(self._ripple_rect())
+
+    def _on_ripple_done(self):
+        """Zero the ripple state so later paints skip it entirely.
+
+        One final full repaint clears any antialiasing remnants; after
+        this, paintEvent's opacity guard makes the ripple free until the
+        next click.
+        """
+        self._ripple_radius = 0
+        self._ripple_opacity = 0
         self.update()
-    
+
     def mousePressEvent(self, event):
         self._ripple_pos = event.pos()
-        max_radius = max(self.width(), self.height()) * 1.5
-        
-        self._radius_anim.setStartValue(0)
-        self._radius_anim.setEndValue(int(max_radius))
-        self._opacity_anim.setStartValue(120)
-        self._opacity_anim.setEndValue(0)
-        
-        self._radius_anim.start()
-        self._opacity_anim.start()
+        self._ripple_max_radius = int(max(self.width(), self.height()) * 1.5)
+
+        self._ripple_anim.stop()
+        self._ripple_anim.start()
         super().mousePressEvent(event)
     
     def paintEvent(self, event):
@@ -95,12 +145,19 @@ class GlassRippleButton(QPushButton):
         if self._ripple_opacity > 0:
             painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing)
-            gradient = QRadialGradient(self._ripple_pos, self._ripple_radius)
-            ripple_color = QColor(255, 255, 255, self._ripple_opacity)
-            gradient.setColorAt(0, ripple_color)
-            gradient.setColorAt(0.7, QColor(255, 255, 255, self._ripple_opacity // 2))
-            gradient.setColorAt(1, QColor(255, 255, 255, 0))
-            painter.setBrush(QBrush(gradient))
+            # Shade only the invalidated region; without the clip the
+            # gradient fill is evaluated over the whole button even when
+            # just the ripple's bounding rect was dirtied
+            painter.setClipRect(event.rect())
+            self._gradient.setCenter(self._ripple_pos)
+            self._gradient.setFocalPoint(self._ripple_pos)
+            self._gradient.setRadius(max(self._ripple_radius, 1))
+            self._gradient.setColorAt(0, QColor(255, 255, 255, self._ripple_opacity))
+            self._gradient.setColorAt(0.7, QColor(255, 255, 255, self._ripple_opacity // 2))
+            self._gradient.setColorAt(1, QColor(255, 255, 255, 0))
+            # QBrush detaches from a mutated gradient, so re-point it
+            self._brush = QBrush(self._gradient)
+            painter.setBrush(self._brush)
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(self.rect(), 10, 10)
             painter.end()
@@ -108,22 +165,10 @@ class GlassRippleButton(QPushButton):
 
 class LoginDialog(QDialog):
     """Modern login/register dialog with sliding animation."""
-    
-    def __init__(self, api_client, parent=None):
-        super().__init__(parent)
-        self.api_client = api_client
-        self.user_data = None
-        self.is_signup_mode = False
-        
-        self.setAttribute(Qt.WA_TranslucentBackground, True)
-        self.setup_ui()
-    
-    def setup_ui(self):
-        """Setup UI with sliding panels."""
-        self.setWindowTitle("Login")
-        self.setFixedSize(450, 620)
-        
-        self.setStyleSheet("""
+
+    # Built once at class creation; setup_ui used to assemble this string
+    # per dialog, re-parsing ~40 lines of QSS on every construction
+    _QSS = """
             QDialog {
                 background-color: rgba(15, 15, 26, 220);
                 border-radius: 16px;
@@ -153,8 +198,8 @@ class LoginDialog(QDialog):
             }
             QPushButton#primaryBtn {
                 padding: 14px;
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 rgba(124, 58, 237, 240), 
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 rgba(124, 58, 237, 240),
                     stop:0.3 rgba(167, 139, 250, 200),
                     stop:0.7 rgba(139, 92, 246, 220),
                     stop:1 rgba(109, 40, 217, 240));
@@ -165,14 +210,14 @@ class LoginDialog(QDialog):
                 font-weight: 600;
             }
             QPushButton#primaryBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 rgba(139, 92, 246, 255), 
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 rgba(139, 92, 246, 255),
                     stop:0.5 rgba(192, 168, 255, 230),
                     stop:1 rgba(124, 58, 237, 255));
             }
             QPushButton#primaryBtn:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 rgba(91, 33, 182, 255), 
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 rgba(91, 33, 182, 255),
                     stop:1 rgba(109, 40, 217, 255));
             }
             QPushButton#linkBtn {
@@ -186,8 +231,27 @@ class LoginDialog(QDialog):
                 color: #c4b5fd;
                 text-decoration: underline;
             }
-        """)
+        """
+
+    def __init__(self, api_client, parent=None):
+        super().__init__(parent)
+        self.api_client = api_client
+        self.user_data = None
+        self.is_signup_mode = False
+        # A double-click can re-enter the handlers before the disabled
+        # state paints; only one auth request may be in flight
+        self._auth_in_flight = False
         
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """Setup UI with sliding panels."""
+        self.setWindowTitle("Login")
+        self.setFixedSize(450, 620)
+
+        self.setStyleSheet(self._QSS)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(25, 25, 25, 25)
         
@@ -198,22 +262,24 @@ class LoginDialog(QDialog):
         card_layout.setSpacing(8)
         card_layout.setContentsMargins(32, 28, 32, 24)
         
+        icon_font, title_font, subtitle_font = _shared_fonts()
+
         # Icon
         icon = QLabel("⚗️")
-        icon.setFont(QFont("Segoe UI Emoji", 36))
+        icon.setFont(icon_font)
         icon.setAlignment(Qt.AlignCenter)
         card_layout.addWidget(icon)
-        
+
         # Title (will change based on mode)
         self.title_label = QLabel("Chemical Equipment")
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self.title_label.setFont(title_font)
         self.title_label.setStyleSheet("color: #ffffff;")
         card_layout.addWidget(self.title_label)
-        
+
         self.subtitle_label = QLabel("Visualizer")
         self.subtitle_label.setAlignment(Qt.AlignCenter)
-        self.subtitle_label.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        self.subtitle_label.setFont(subtitle_font)
         self.subtitle_label.setStyleSheet("color: #a78bfa;")
         card_layout.addWidget(self.subtitle_label)
         
@@ -374,7 +440,7 @@ class LoginDialog(QDialog):
             self.toggle_text.setText("Already have an account?")
             self.toggle_btn.setText("Sign In")
             self.demo_hint.hide()
-            self.setFixedSize(450, 680)
+            self._animate_height(680)
         else:
             self.stack.setCurrentIndex(0)
             self.title_label.setText("Chemical Equipment")
@@ -382,8 +448,26 @@ class LoginDialog(QDialog):
             self.toggle_text.setText("Don't have an account?")
             self.toggle_btn.setText("Sign Up")
             self.demo_hint.show()
-            self.setFixedSize(450, 620)
-    
+            self._animate_height(620)
+
+    def _animate_height(self, height):
+        """Resize to the target height over a short animation.
+
+        The old synchronous setFixedSize forced one full layout pass and
+        repaint in a single frame; stepping the height through the event
+        loop spreads that work across idle slots (and matches the
+        dialog's sliding-panel feel). setFixedSize is driven per frame
+        because the fixed-size constraint would clamp a plain b"size"
+        property animation.
+        """
+        anim = QVariantAnimation(self)
+        anim.setDuration(200)
+        anim.setEasingCurve(QEasingCurve.OutCubic)
+        anim.setStartValue(self.height())
+        anim.setEndValue(height)
+        anim.valueChanged.connect(lambda v: self.setFixedSize(450, int(v)))
+        anim.start(QVariantAnimation.DeleteWhenStopped)
+
     def handle_login(self):
         """Handle login."""
         username = self.login_username.text().strip()
@@ -393,15 +477,18 @@ class LoginDialog(QDialog):
             QMessageBox.warning(self, "Error", "Enter username and password")
             return
         
+        if self._auth_in_flight:
+            return
+        self._auth_in_flight = True
         self._set_loading(True, self.login_btn, "Signing in...")
-        
-        self.auth_thread = AuthThread(
+
+        task = AuthRunnable(
             self.api_client, 'login',
             username=username, password=password
         )
-        self.auth_thread.success.connect(self._on_success)
-        self.auth_thread.error.connect(lambda e: self._on_error(e, self.login_btn, "Sign In"))
-        self.auth_thread.start()
+        task.signals.success.connect(self._on_success)
+        task.signals.error.connect(lambda e: self._on_error(e, self.login_btn, "Sign In"))
+        QThreadPool.globalInstance().start(task)
     
     def handle_signup(self):
         """Handle signup."""
@@ -422,35 +509,42 @@ class LoginDialog(QDialog):
             QMessageBox.warning(self, "Error", "Password must be at least 6 characters")
             return
         
+        if self._auth_in_flight:
+            return
+        self._auth_in_flight = True
         self._set_loading(True, self.signup_btn, "Creating account...")
-        
-        self.auth_thread = AuthThread(
+
+        task = AuthRunnable(
             self.api_client, 'register',
             username=username, email=email,
             password=password, confirm_password=confirm
         )
-        self.auth_thread.success.connect(self._on_success)
-        self.auth_thread.error.connect(lambda e: self._on_error(e, self.signup_btn, "Create Account"))
-        self.auth_thread.start()
+        task.signals.success.connect(self._on_success)
+        task.signals.error.connect(lambda e: self._on_error(e, self.signup_btn, "Create Account"))
+        QThreadPool.globalInstance().start(task)
     
     def _set_loading(self, loading, btn, text):
         """Set loading state."""
-        btn.setText(text)
-        btn.setEnabled(not loading)
-        
-        # Disable all inputs
-        for widget in [self.login_username, self.login_password, 
-                       self.signup_username, self.signup_email,
-                       self.signup_password, self.signup_confirm]:
-            widget.setEnabled(not loading)
+        # Disabling the stack propagates to every input in one traversal
+        # instead of six setEnabled calls, and suspending updates batches
+        # the resulting style invalidations into a single repaint
+        self.stack.setUpdatesEnabled(False)
+        try:
+            btn.setText(text)
+            btn.setEnabled(not loading)
+            self.stack.setEnabled(not loading)
+        finally:
+            self.stack.setUpdatesEnabled(True)
     
     def _on_success(self, data):
         """Handle successful auth."""
+        self._auth_in_flight = False
         self.user_data = data
         self.accept()
-    
+
     def _on_error(self, error_msg, btn, original_text):
         """Handle auth error."""
+        self._auth_in_flight = False
         self._set_loading(False, btn, original_text)
         
         # Parse error message
@@ -3,75 +3,158 @@ Polished Main Window for Chemical Equipment Visualizer.
 """
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QLabel, QPushButton, QTableWidget, QTableWidgetItem, QFileDialog,
+    QLabel, QPushButton, QTableView, QFileDialog,
     QMessageBox, QFrame, QListWidget, QListWidgetItem, QHeaderView, QSplitter,
     QApplication
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool,
+    pyqtSignal, QTimer
+)
 from PyQt5.QtGui import QFont, QColor
 
-from .charts_widget import ChartsWidget
+# Window fonts, resolved through the font matcher once per process, as in
+# ui.login_dialog. Built lazily because QFont needs a QApplication first.
+_FONTS = None
+
 
+def _shared_fonts():
+    """Return the (logo, upload icon, loading icon) fonts, created on first use."""
+    global _FONTS
+    if _FONTS is None:
+        _FONTS = (
+            QFont("Segoe UI", 16, QFont.Bold),
+            QFont("Segoe UI Emoji", 56),
+            QFont("Segoe UI Emoji", 48),
+        )
+    return _FONTS
 
-class DataLoaderThread(QThread):
-    """Background thread for loading data."""
-    finished = pyqtSignal(list, dict)
+
+class _DataSignals(QObject):
+    """Signal holder for DataLoaderTask (QRunnable cannot emit directly)."""
+    finished = pyqtSignal(list, dict, list)
     error = pyqtSignal(str)
-    
+
+
+class DataLoaderTask(QRunnable):
+    """Pooled task for loading equipment, summary and history.
+
+    Runs on the global QThreadPool instead of a freshly spawned QThread
+    per refresh, so repeated loads reuse a warm worker. The client's
+    refresh() issues the three GETs concurrently, so one task delivers
+    everything in max(RTT) instead of a data thread plus a separate
+    history thread each paying their own round trips.
+    """
+
     def __init__(self, api_client, session_id=None):
         super().__init__()
         self.api_client = api_client
         self.session_id = session_id
-    
+        self.signals = _DataSignals()
+
     def run(self):
         try:
-            equipment = self.api_client.get_equipment(self.session_id)
-            summary = self.api_client.get_summary(self.session_id)
-            self.finished.emit(equipment, summary)
+            data = self.api_client.refresh(self.session_id)
+            self.signals.finished.emit(
+                data['equipment'], data['summary'], data['history']
+            )
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
-class HistoryLoaderThread(QThread):
-    """Background thread for loading upload history."""
-    finished = pyqtSignal(list)
+class _PdfSignals(QObject):
+    """Signal holder for PdfDownloadTask."""
+    finished = pyqtSignal(str)
     error = pyqtSignal(str)
-    
-    def __init__(self, api_client):
+
+
+class PdfDownloadTask(QRunnable):
+    """Pooled task that streams the PDF report straight to disk.
+
+    The client writes the response in 64 KiB chunks, so peak memory
+    stays at one chunk instead of the whole report, and the UI thread
+    never blocks on the round trip.
+    """
+
+    def __init__(self, api_client, session_id, path):
         super().__init__()
         self.api_client = api_client
-    
+        self.session_id = session_id
+        self.path = path
+        self.signals = _PdfSignals()
+
     def run(self):
         try:
-            history = self.api_client.get_history()
-            self.finished.emit(history)
+            with open(self.path, 'wb') as f:
+                self.api_client.download_pdf(self.session_id, out=f)
+            self.signals.finished.emit(self.path)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+
+class EquipmentModel(QAbstractTableModel):
+    """Read-only table model over column-wise equipment data.
+
+    Qt pulls cell strings lazily through data() for the visible rows
+    only, so a reload costs one model reset and five plain lists instead
+    of five QTableWidgetItem allocations per row.
+    """
+
+    HEADERS = ("Equipment Name", "Type", "Flowrate", "Pressure", "Temperature")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = ([], [], [], [], [])
+
+    def set_rows(self, equipment):
+        """Replace the model contents from a list of equipment dicts."""
+        names, types, flows, pressures, temps = [], [], [], [], []
+        for eq in equipment:
+            g = eq.get
+            names.append(g('name', ''))
+            types.append(str(g('equipment_type', '')))
+            flows.append(str(g('flowrate', '')))
+            pressures.append(str(g('pressure', '')))
+            temps.append(str(g('temperature', '')))
+        self.beginResetModel()
+        self._columns = (names, types, flows, pressures, temps)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns[0])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._columns[index.column()][index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
 
 
 class MainWindow(QMainWindow):
     """Polished main window."""
-    
-    def __init__(self, api_client):
-        super().__init__()
-        self.api_client = api_client
-        self.equipment = []
-        self.summary = {}
-        self.current_session_id = None
-        
-        # Enable translucent background
-        self.setAttribute(Qt.WA_TranslucentBackground, True)
-        
-        self.setup_ui()
-        self.load_data()
-    
-    def setup_ui(self):
-        """Setup the UI."""
-        self.setWindowTitle("Chemical Equipment Visualizer")
-        self.setMinimumSize(1280, 850)
-        
-        # Modern dark theme with purple accents and translucency
-        self.setStyleSheet("""
+
+    # Fixed format per stat key; saves the per-refresh isinstance
+    # dispatch the old float/str branching did for every card
+    STAT_FMT = {
+        'total_count': '{:d}',
+        'avg_flowrate': '{:.1f}',
+        'avg_pressure': '{:.1f}',
+        'avg_temperature': '{:.1f}',
+    }
+
+    # Modern dark theme with purple accents and translucency. Built once
+    # at class creation like LoginDialog._QSS; kept per-window rather
+    # than applied at QApplication level because the two windows carry
+    # conflicting QPushButton/QWidget rules that would cascade into each
+    # other.
+    _QSS = """
             QMainWindow {
                 background-color: rgba(15, 15, 26, 230);
             }
@@ -80,10 +163,7 @@ class MainWindow(QMainWindow):
                 color: #e0e0e0;
                 font-family: 'Segoe UI', sans-serif;
             }
-                color: #e0e0e0;
-                font-family: 'Segoe UI', sans-serif;
-            }
-            
+
             /* Tabs */
             QTabWidget::pane {
                 border: none;
@@ -107,20 +187,20 @@ class MainWindow(QMainWindow):
                 background-color: #1e1e38;
                 color: #c0c0d0;
             }
-            
+
             /* Tables */
-            QTableWidget {
+            QTableView {
                 background-color: rgba(22, 22, 42, 220);
                 border: 1px solid #252545;
                 border-radius: 10px;
                 gridline-color: #252545;
                 font-size: 13px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px;
                 border-bottom: 1px solid #1e1e38;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #7c3aed;
             }
             QHeaderView::section {
@@ -131,7 +211,7 @@ class MainWindow(QMainWindow):
                 font-weight: 600;
                 font-size: 12px;
             }
-            
+
             /* Buttons */
             QPushButton {
                 padding: 10px 20px;
@@ -152,7 +232,7 @@ class MainWindow(QMainWindow):
                 background-color: #303050;
                 color: #606080;
             }
-            
+
             /* List */
             QListWidget {
                 background-color: rgba(22, 22, 42, 220);
@@ -169,7 +249,7 @@ class MainWindow(QMainWindow):
             QListWidget::item:hover:!selected {
                 background-color: #1e1e38;
             }
-            
+
             /* Horizontal Scrollbar */
             QScrollBar:horizontal {
                 background: rgba(22, 22, 42, 180);
@@ -187,7 +267,7 @@ class MainWindow(QMainWindow):
             QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
                 width: 0;
             }
-            
+
             /* Scrollbar */
             QScrollBar:vertical {
                 background: rgba(22, 22, 42, 180);
@@ -205,7 +285,41 @@ class MainWindow(QMainWindow):
             QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
                 height: 0;
             }
-        """)
+        """
+
+
+    def __init__(self, api_client):
+        super().__init__()
+        self.api_client = api_client
+        self.equipment = []
+        self.summary = {}
+        self.current_session_id = None
+        # Charts are built on first visit to their tab; data that arrives
+        # before then is parked here
+        self.charts_widget = None
+        self._pending_chart_data = None
+        # Coalesce rapid history selections (arrow-keying through the
+        # list) into one load of the last session picked
+        self._pending_session_id = None
+        self._history_timer = QTimer(self)
+        self._history_timer.setSingleShot(True)
+        self._history_timer.setInterval(150)
+        self._history_timer.timeout.connect(self._do_history_load)
+        
+        # Enable translucent background
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        
+        self.setup_ui()
+        # Let the window paint before the first fetch kicks off; a
+        # zero-timeout shot runs load_data on the next event-loop turn
+        QTimer.singleShot(0, self.load_data)
+    
+    def setup_ui(self):
+        """Setup the UI."""
+        self.setWindowTitle("Chemical Equipment Visualizer")
+        self.setMinimumSize(1280, 850)
+        
+        self.setStyleSheet(self._QSS)
         
         central = QWidget()
         self.setCentralWidget(central)
@@ -223,6 +337,7 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(self.create_data_tab(), "📊 Data")
         self.tabs.addTab(self.create_charts_tab(), "📈 Charts")
         self.tabs.addTab(self.create_history_tab(), "📜 History")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
         
         # Loading overlay (initially hidden)
@@ -243,7 +358,7 @@ class MainWindow(QMainWindow):
         overlay_layout.setAlignment(Qt.AlignCenter)
         
         loading_icon = QLabel("⏳")
-        loading_icon.setFont(QFont("Segoe UI Emoji", 48))
+        loading_icon.setFont(_shared_fonts()[2])
         loading_icon.setAlignment(Qt.AlignCenter)
         overlay_layout.addWidget(loading_icon)
         
@@ -287,7 +402,7 @@ class MainWindow(QMainWindow):
         
         # Logo
         logo = QLabel("⚗️ Chemical Equipment Visualizer")
-        logo.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        logo.setFont(_shared_fonts()[0])
         logo.setStyleSheet("color: #ffffff; border: none;")
         layout.addWidget(logo)
         
@@ -350,7 +465,7 @@ class MainWindow(QMainWindow):
         card_layout.setSpacing(16)
         
         icon = QLabel("📁")
-        icon.setFont(QFont("Segoe UI Emoji", 56))
+        icon.setFont(_shared_fonts()[1])
         icon.setAlignment(Qt.AlignCenter)
         card_layout.addWidget(icon)
         
@@ -431,11 +546,9 @@ class MainWindow(QMainWindow):
         layout.addWidget(table_label)
         
         # Table
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(5)
-        self.data_table.setHorizontalHeaderLabels([
-            "Equipment Name", "Type", "Flowrate", "Pressure", "Temperature"
-        ])
+        self.equipment_model = EquipmentModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.equipment_model)
         # First column stretches, others fit to content
         header = self.data_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
@@ -450,10 +563,31 @@ class MainWindow(QMainWindow):
         
         return tab
     
+    # Tab indices
+    CHARTS_TAB = 2
+
     def create_charts_tab(self):
-        """Create charts tab."""
+        """Create a placeholder; the charts widget is built on first visit.
+
+        Instantiating ChartsWidget pulls in matplotlib and builds nine
+        figures — a noticeable chunk of startup that is wasted whenever
+        the user never opens the tab.
+        """
+        placeholder = QWidget()
+        self._charts_layout = QVBoxLayout(placeholder)
+        self._charts_layout.setContentsMargins(0, 0, 0, 0)
+        return placeholder
+
+    def _on_tab_changed(self, index):
+        """Build the charts widget the first time its tab is shown."""
+        if index != self.CHARTS_TAB or self.charts_widget is not None:
+            return
+        from .charts_widget import ChartsWidget
         self.charts_widget = ChartsWidget()
-        return self.charts_widget
+        self._charts_layout.addWidget(self.charts_widget)
+        if self._pending_chart_data is not None:
+            self.charts_widget.update_data(*self._pending_chart_data)
+            self._pending_chart_data = None
     
     def create_history_tab(self):
         """Create history tab."""
@@ -487,59 +621,46 @@ class MainWindow(QMainWindow):
     def load_data(self, session_id=None):
         """Load data with loading indicator."""
         self._show_loading("Loading data...")
-        self.loader = DataLoaderThread(self.api_client, session_id)
-        self.loader.finished.connect(self.on_data_loaded)
-        self.loader.error.connect(self._on_data_error)
-        self.loader.start()
-        self.load_history()
+
+        # History placeholder until the combined load lands
+        self.history_list.clear()
+        loading_item = QListWidgetItem("⏳ Loading history...")
+        loading_item.setFlags(loading_item.flags() & ~Qt.ItemIsSelectable)
+        self.history_list.addItem(loading_item)
+
+        task = DataLoaderTask(self.api_client, session_id)
+        task.signals.finished.connect(self.on_data_loaded)
+        task.signals.error.connect(self._on_data_error)
+        QThreadPool.globalInstance().start(task)
     
     def _on_data_error(self, error):
         """Handle data loading error."""
         self._hide_loading()
     
-    def on_data_loaded(self, equipment, summary):
+    def on_data_loaded(self, equipment, summary, history):
         """Handle data loaded."""
         self.equipment = equipment
         self.summary = summary
         self.update_ui()
+        self._on_history_loaded(history)
         self._hide_loading()
     
     def update_ui(self):
         """Update UI."""
         # Stats
         for key, label in self.stat_labels.items():
-            val = self.summary.get(key, 0)
-            if val is None:
-                val = 0
-            if isinstance(val, float):
-                label.setText(f"{val:.1f}")
-            else:
-                label.setText(str(val))
-        
-        # Table
-        self.data_table.setRowCount(len(self.equipment))
-        for row, eq in enumerate(self.equipment):
-            self.data_table.setItem(row, 0, QTableWidgetItem(eq.get('name', '')))
-            self.data_table.setItem(row, 1, QTableWidgetItem(eq.get('equipment_type', '')))
-            self.data_table.setItem(row, 2, QTableWidgetItem(str(eq.get('flowrate', ''))))
-            self.data_table.setItem(row, 3, QTableWidgetItem(str(eq.get('pressure', ''))))
-            self.data_table.setItem(row, 4, QTableWidgetItem(str(eq.get('temperature', ''))))
-        
-        self.charts_widget.update_data(self.equipment, self.summary)
-    
-    def load_history(self):
-        """Load history asynchronously."""
-        # Show loading indicator
-        self.history_list.clear()
-        loading_item = QListWidgetItem("⏳ Loading history...")
-        loading_item.setFlags(loading_item.flags() & ~Qt.ItemIsSelectable)
-        self.history_list.addItem(loading_item)
+            val = self.summary.get(key) or 0
+            if key == 'total_count':
+                val = int(val)
+            label.setText(self.STAT_FMT[key].format(val))
         
-        # Use background thread
-        self.history_loader = HistoryLoaderThread(self.api_client)
-        self.history_loader.finished.connect(self._on_history_loaded)
-        self.history_loader.error.connect(lambda e: None)
-        self.history_loader.start()
+        # Table: one model reset; the view fetches only the visible cells
+        self.equipment_model.set_rows(self.equipment)
+
+        if self.charts_widget is not None:
+            self.charts_widget.update_data(self.equipment, self.summary)
+        else:
+            self._pending_chart_data = (self.equipment, self.summary)
     
     def _on_history_loaded(self, history):
         """Handle history data loaded."""
@@ -552,8 +673,13 @@ class MainWindow(QMainWindow):
             self.history_list.addItem(item)
     
     def on_history_click(self, item):
-        """Handle history click."""
-        self.current_session_id = item.data(Qt.UserRole)
+        """Handle history click; only the last pick in a burst loads."""
+        self._pending_session_id = item.data(Qt.UserRole)
+        self._history_timer.start()
+
+    def _do_history_load(self):
+        """Load the most recently selected history session."""
+        self.current_session_id = self._pending_session_id
         self.load_data(self.current_session_id)
         self.tabs.setCurrentIndex(1)
     
@@ -582,23 +708,32 @@ class MainWindow(QMainWindow):
             self.upload_btn.setEnabled(True)
     
     def download_pdf(self):
-        """Download PDF."""
-        try:
-            self.pdf_btn.setText("Generating...")
-            self.pdf_btn.setEnabled(False)
-            
-            data = self.api_client.download_pdf(self.current_session_id)
-            path, _ = QFileDialog.getSaveFileName(self, "Save PDF", "equipment_report.pdf", "PDF (*.pdf)")
-            
-            if path:
-                with open(path, 'wb') as f:
-                    f.write(data)
-                QMessageBox.information(self, "Success", f"Report saved to {path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-        finally:
-            self.pdf_btn.setText("📥 Download PDF")
-            self.pdf_btn.setEnabled(True)
+        """Download PDF, streamed to disk off the UI thread."""
+        path, _ = QFileDialog.getSaveFileName(self, "Save PDF", "equipment_report.pdf", "PDF (*.pdf)")
+        if not path:
+            return
+
+        self.pdf_btn.setText("Generating...")
+        self.pdf_btn.setEnabled(False)
+
+        task = PdfDownloadTask(self.api_client, self.current_session_id, path)
+        task.signals.finished.connect(self._on_pdf_done)
+        task.signals.error.connect(self._on_pdf_error)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_pdf_done(self, path):
+        """Handle PDF saved."""
+        self._reset_pdf_btn()
+        QMessageBox.information(self, "Success", f"Report saved to {path}")
+
+    def _on_pdf_error(self, error):
+        """Handle PDF download failure."""
+        self._reset_pdf_btn()
+        QMessageBox.critical(self, "Error", error)
+
+    def _reset_pdf_btn(self):
+        self.pdf_btn.setText("📥 Download PDF")
+        self.pdf_btn.setEnabled(True)
     
     def logout(self):
         """Logout."""